@@ -17,86 +17,82 @@ Example:
     ...     print(f"{resource['type']}.{resource['name']}")
 """
 
-from .parsers.variable_parser import parse_type_constraint
-from .services.artifact_parsers import TfPlanParser, TfStateParser, TfVarsParser
-from .services.terraform_json_parser import TerraformJsonParser
-from .services.terraform_parser import TerraformParser
-from .types import (
-    # Literal types
-    BlockKind,
-    ExpressionKind,
-    GraphNodeKind,
-    # Reference types
-    CountReference,
-    DataReference,
-    EachReference,
-    LocalReference,
-    ModuleOutputReference,
-    PathReference,
-    Reference,
-    ReferenceDict,
-    ResourceReference,
-    SelfReference,
-    VariableReference,
-    # Value types
-    ArrayValue,
-    ExpressionValue,
-    LiteralValue,
-    ObjectValue,
-    Value,
-    # Block types
-    DataBlock,
-    DynamicBlock,
-    GenericBlock,
-    HclBlock,
-    LocalValue,
-    ModuleBlock,
-    NestedBlock,
-    OutputBlock,
-    ParsedBody,
-    ProviderBlock,
-    ResourceBlock,
-    TerraformSettingsBlock,
-    TypeConstraint,
-    VariableBlock,
-    VariableValidation,
-    # Document types
-    DirectoryParseOptions,
-    DirectoryParseResult,
-    FileParseResult,
-    SerializeOptions,
-    TerraformDocument,
-    # Graph types
-    DependencyGraph,
-    GraphEdge,
-    GraphEdgeCompat,
-    GraphNode,
-    TerraformExport,
-    # Artifact types
-    PlanChange,
-    PlanModule,
-    PlanResource,
-    PlanResourceChange,
-    PlannedValues,
-    TerraformPlanDocument,
-    TerraformStateDocument,
-    TerraformStateInstance,
-    TerraformStateOutput,
-    TerraformStateResource,
-    TfVarsDocument,
-    # Functions
-    create_empty_document,
-)
-from .utils.common.errors import (
-    ParseError,
-    SourceLocation,
-    SourceRange,
-    offset_to_location,
-    offsets_to_range,
-)
-from .utils.graph.graph_builder import build_dependency_graph, create_export
-from .utils.parser.value_classifier import classify_value
-from .utils.serialization.serializer import to_export, to_json, to_json_export, to_yaml_document
+from __future__ import annotations
+
+from importlib import import_module
+from typing import TYPE_CHECKING, Any, Dict
+
+if TYPE_CHECKING:
+    from .parsers.variable_parser import parse_type_constraint
+    from .services.artifact_parsers import TfPlanParser, TfStateParser, TfVarsParser
+    from .services.terraform_json_parser import TerraformJsonParser
+    from .services.terraform_parser import TerraformParser
+    from .types import *  # noqa: F401,F403
+    from .utils.common.errors import (
+        ParseError,
+        SourceLocation,
+        SourceRange,
+        offset_to_location,
+        offsets_to_range,
+    )
+    from .utils.graph.graph_builder import build_dependency_graph, create_export
+    from .utils.parser.value_classifier import classify_value
+    from .utils.serialization.serializer import (
+        to_export,
+        to_json,
+        to_json_export,
+        to_json_export_stream,
+        to_json_stream,
+        to_yaml_document,
+    )
+
+# Public name -> defining submodule. Resolved on first attribute access (PEP 562)
+# so that ``import parse_hcl`` does not pull in the parser, graph, and
+# serialization machinery until one of their symbols is actually used.
+_LAZY_EXPORTS: Dict[str, str] = {
+    # Parsers
+    "TerraformParser": ".services.terraform_parser",
+    "TerraformJsonParser": ".services.terraform_json_parser",
+    "TfVarsParser": ".services.artifact_parsers",
+    "TfStateParser": ".services.artifact_parsers",
+    "TfPlanParser": ".services.artifact_parsers",
+    # Serialization
+    "to_json": ".utils.serialization.serializer",
+    "to_json_export": ".utils.serialization.serializer",
+    "to_json_stream": ".utils.serialization.serializer",
+    "to_json_export_stream": ".utils.serialization.serializer",
+    "to_export": ".utils.serialization.serializer",
+    "to_yaml_document": ".utils.serialization.serializer",
+    # Graph
+    "build_dependency_graph": ".utils.graph.graph_builder",
+    "create_export": ".utils.graph.graph_builder",
+    # Errors
+    "ParseError": ".utils.common.errors",
+    "SourceLocation": ".utils.common.errors",
+    "SourceRange": ".utils.common.errors",
+    "offset_to_location": ".utils.common.errors",
+    "offsets_to_range": ".utils.common.errors",
+    # Utilities
+    "classify_value": ".utils.parser.value_classifier",
+    "parse_type_constraint": ".parsers.variable_parser",
+}
+
+
+def __getattr__(name: str) -> Any:
+    module_name = _LAZY_EXPORTS.get(name)
+    if module_name is None:
+        if name not in __all__:
+            raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+        # Everything else in __all__ is a type (or helper) from .types
+        module_name = ".types"
+    value = getattr(import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(__all__))
+
 
 __all__ = [
     # Parsers
@@ -108,6 +104,8 @@ __all__ = [
     # Serialization
     "to_json",
     "to_json_export",
+    "to_json_stream",
+    "to_json_export_stream",
     "to_export",
     "to_yaml_document",
     # Graph
@@ -1,84 +1,82 @@
 from __future__ import annotations
 
+import os
 import sys
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache, partial
 from pathlib import Path
-from typing import Any, Dict, List
+from typing import Any, Callable, Dict, List, TextIO, Tuple
 
 from .services.artifact_parsers import TfPlanParser, TfStateParser, TfVarsParser
 from .services.terraform_parser import TerraformParser
 from .utils.output_metadata import annotate_output_metadata
-from .utils.serialization.serializer import to_json, to_json_export, to_yaml_document
+from .utils.serialization.serializer import to_json, to_json_export, to_json_export_stream, to_json_stream, to_yaml_document
 
 DEFAULT_SINGLE_BASENAME = "parse-hcl-output"
 DEFAULT_COMBINED_BASENAME = "parse-hcl-output.combined"
 DEFAULT_PER_FILE_DIR = "parse-hcl-output/files"
+TFVARS_SUFFIXES = (".tfvars", ".tfvars.json")
 
 
 def _usage() -> str:
     return (
         "Usage: parse-hcl --file <path> | --dir <path> [--format json|yaml] "
-        "[--graph] [--no-prune] [--out <path>] [--out-dir <dir>] [--stdout]"
+        "[--graph] [--no-prune] [--out <path>] [--out-dir <dir>] [--jobs <n|auto>] [--stdout]"
     )
 
 
+VALUE_FLAGS: Dict[str, str] = {
+    "--file": "file",
+    "--dir": "dir",
+    "--format": "format",
+    "--out": "out",
+    "--out-dir": "out_dir",
+    "--jobs": "jobs",
+}
+"""Flags that take a value, mapped to their option key."""
+
+SWITCH_FLAGS: Dict[str, Tuple[str, bool]] = {
+    "--graph": ("graph", True),
+    "--no-prune": ("prune", False),
+    "--split": ("split", True),
+    "--no-split": ("split", False),
+    "--stdout": ("stdout", True),
+    "--no-stdout": ("stdout", False),
+}
+"""Boolean flags, mapped to their option key and the value they set."""
+
+FORMATS = ("json", "yaml")
+
+
 def parse_args(argv: list[str]) -> Dict[str, Any]:
     opts: Dict[str, Any] = {"format": "json", "graph": False, "prune": True, "split": True, "stdout": False}
     i = 0
-    while i < len(argv):
+    count = len(argv)
+    while i < count:
         arg = argv[i]
-        if arg == "--file" and i + 1 < len(argv):
-            opts["file"] = argv[i + 1]
-            i += 2
-            continue
-        if arg == "--dir" and i + 1 < len(argv):
-            opts["dir"] = argv[i + 1]
-            i += 2
-            continue
-        if arg == "--format" and i + 1 < len(argv):
-            fmt = argv[i + 1]
-            if fmt in ("json", "yaml"):
-                opts["format"] = fmt
-            i += 2
-            continue
-        if arg == "--graph":
-            opts["graph"] = True
-            i += 1
-            continue
-        if arg == "--no-prune":
-            opts["prune"] = False
+        switch = SWITCH_FLAGS.get(arg)
+        if switch is not None:
+            opts[switch[0]] = switch[1]
             i += 1
             continue
-        if arg == "--out" and i + 1 < len(argv):
-            opts["out"] = argv[i + 1]
-            i += 2
-            continue
-        if arg == "--out-dir" and i + 1 < len(argv):
-            opts["out_dir"] = argv[i + 1]
+
+        key = VALUE_FLAGS.get(arg)
+        if key is not None and i + 1 < count:
+            value = argv[i + 1]
+            # Unsupported formats are ignored and the default is kept
+            if key != "format" or value in FORMATS:
+                opts[key] = value
             i += 2
             continue
-        if arg == "--split":
-            opts["split"] = True
-            i += 1
-            continue
-        if arg == "--no-split":
-            opts["split"] = False
-            i += 1
-            continue
-        if arg == "--stdout":
-            opts["stdout"] = True
-            i += 1
-            continue
-        if arg == "--no-stdout":
-            opts["stdout"] = False
-            i += 1
-            continue
+
+        # Unknown arguments and value flags without a value are skipped
         i += 1
     return opts
 
 
 def main() -> None:
     opts = parse_args(sys.argv[1:])
-    parser = TerraformParser()
+    parser = _terraform_parser()
 
     if not opts.get("file") and not opts.get("dir"):
         print(_usage(), file=sys.stderr)
@@ -87,16 +85,16 @@ def main() -> None:
     if opts.get("file"):
         file_path = Path(opts["file"]).resolve()
         suffix = file_path.suffix
-        file_str = str(file_path)
+        file_name = file_path.name
 
-        if "tfvars" in file_str:
+        if file_name.endswith(TFVARS_SUFFIXES):
             emit_single(file_path, _tfvars_parse(file_path), opts)
             return
         if suffix == ".tfstate":
-            emit_single(file_path, TfStateParser().parse_file(str(file_path)), opts)
+            emit_single(file_path, _tfstate_parser().parse_file(str(file_path)), opts)
             return
-        if suffix == ".json" and file_str.endswith("plan.json"):
-            emit_single(file_path, TfPlanParser().parse_file(str(file_path)), opts)
+        if suffix == ".json" and file_name.endswith("plan.json"):
+            emit_single(file_path, _tfplan_parser().parse_file(str(file_path)), opts)
             return
 
         doc = parser.parse_file(str(file_path))
@@ -105,24 +103,49 @@ def main() -> None:
 
     if opts.get("dir"):
         dir_path = Path(opts["dir"]).resolve()
-        result = parser.parse_directory(str(dir_path))
+        result = parser.parse_directory(str(dir_path), jobs=_parse_jobs(opts.get("jobs")))
         combined = result.get("combined") or parser.combine([item["document"] for item in result.get("files", [])])
         emit_directory(dir_path, result.get("files", []), combined, opts)
 
 
+def _parse_jobs(value: str | None) -> int | None:
+    if not value:
+        return None
+    if value == "auto":
+        return os.cpu_count() or 1
+    return int(value) if value.isdigit() else None
+
+
 def _tfvars_parse(file_path: Path) -> Any:
-    return TfVarsParser().parse_file(str(file_path))
+    return _tfvars_parser().parse_file(str(file_path))
+
+
+# Parsers are stateless, so one shared instance per process is enough
+@lru_cache(maxsize=1)
+def _terraform_parser() -> TerraformParser:
+    return TerraformParser()
+
+
+@lru_cache(maxsize=1)
+def _tfvars_parser() -> TfVarsParser:
+    return TfVarsParser()
+
+
+@lru_cache(maxsize=1)
+def _tfstate_parser() -> TfStateParser:
+    return TfStateParser()
+
+
+@lru_cache(maxsize=1)
+def _tfplan_parser() -> TfPlanParser:
+    return TfPlanParser()
 
 
 def emit_single(file_path: Path, data: Any, opts: Dict[str, Any]) -> None:
-    rendered = _render(data, opts)
     ext = _ext(opts["format"])
     default_name = f"{DEFAULT_SINGLE_BASENAME}{ext}"
     target_path = _resolve_out_path(opts.get("out"), default_name, opts["format"])
-    _write_file(target_path, rendered)
-
-    if opts.get("stdout"):
-        print(rendered)
+    _emit(target_path, data, opts)
 
 
 def emit_directory(dir_path: Path, files: List[Dict[str, Any]], combined_doc: Dict[str, Any], opts: Dict[str, Any]) -> None:
@@ -136,20 +159,55 @@ def emit_directory(dir_path: Path, files: List[Dict[str, Any]], combined_doc: Di
         cwd=Path.cwd(),
     )
     combined_data = combined_doc if opts.get("graph") else {"combined": combined_doc, "files": files if opts.get("split") else []}
-    combined_rendered = _render(combined_data, opts)
     combined_default = f"{DEFAULT_COMBINED_BASENAME}{ext}"
     combined_target = _resolve_out_path(opts.get("out"), combined_default, opts["format"], is_dir_mode=True)
-    _write_file(combined_target, combined_rendered)
+    _emit(combined_target, combined_data, opts)
+
+    if opts.get("split") and per_file_base and files:
+        write_document = _pick_document_writer(opts)
+        # Per-file outputs are independent, so render and write them concurrently
+        with ThreadPoolExecutor(max_workers=min(32, os.cpu_count() or 4, len(files))) as executor:
+            list(executor.map(lambda file_result: _render_and_write(file_result, dir_path, per_file_base, ext, write_document), files))
+
+
+def _emit(target_path: Path, data: Any, opts: Dict[str, Any]) -> None:
+    # Only materialize the rendered string when it also has to be printed
+    if not opts.get("stdout"):
+        _write_stream(target_path, data, opts)
+        return
+
+    rendered = _render(data, opts)
+    _write_file(target_path, rendered)
+    print(rendered)
+
+
+def _render_and_write(
+    file_result: Dict[str, Any],
+    dir_path: Path,
+    per_file_base: Path,
+    ext: str,
+    write_document: Callable[[Any, TextIO], None],
+) -> None:
+    # annotate_output_metadata has already resolved the path relative to dir_path
+    rel_path = file_result.get("relative_path") or os.path.relpath(file_result["path"], dir_path)
+    per_file_target = per_file_base / Path(f"{rel_path}{ext}")
+    per_file_target.parent.mkdir(parents=True, exist_ok=True)
+    with per_file_target.open("w", encoding="utf-8") as fp:
+        write_document(file_result["document"], fp)
+
+
+def _pick_document_writer(opts: Dict[str, Any]) -> Callable[[Any, TextIO], None]:
+    # Per-file results are always Terraform documents, so the serializer can be chosen once per run
+    prune = opts.get("prune", True)
+    if opts.get("format") == "yaml":
+        return partial(_write_yaml_document, prune_empty=prune)
+    if opts.get("graph"):
+        return partial(to_json_export_stream, prune_empty=prune)
+    return partial(to_json_stream, prune_empty=prune)
 
-    if opts.get("split") and per_file_base:
-        for file_result in files:
-            rel_path = file_result.get("relative_path") or Path(file_result["path"]).resolve().relative_to(dir_path)
-            per_file_target = per_file_base / Path(f"{rel_path}{ext}")
-            rendered = _render(file_result["document"], opts)
-            _write_file(per_file_target, rendered)
 
-    if opts.get("stdout"):
-        print(combined_rendered)
+def _write_yaml_document(document: Any, fp: TextIO, prune_empty: bool = True) -> None:
+    fp.write(to_yaml_document(document, prune_empty=prune_empty))
 
 
 def _render(data: Any, opts: Dict[str, Any]) -> str:
@@ -165,6 +223,21 @@ def _render(data: Any, opts: Dict[str, Any]) -> str:
     return to_json(data, prune_empty=opts.get("prune", True))
 
 
+def _render_to(fp: TextIO, data: Any, opts: Dict[str, Any]) -> None:
+    if opts.get("format") == "yaml":
+        fp.write(_render(data, opts))
+        return
+
+    if opts.get("graph") and not _is_terraform_doc(data):
+        print("Graph export requested but input is not a Terraform document; emitting raw output.", file=sys.stderr)
+
+    if opts.get("graph") and _is_terraform_doc(data):
+        to_json_export_stream(data, fp, prune_empty=opts.get("prune", True))
+        return
+
+    to_json_stream(data, fp, prune_empty=opts.get("prune", True))
+
+
 def _resolve_out_path(out: str | None, default_name: str, fmt: str, is_dir_mode: bool = False) -> Path:
     default_path = Path(default_name).resolve()
     if not out:
@@ -199,6 +272,12 @@ def _write_file(target_path: Path, contents: str) -> None:
     target_path.write_text(contents, encoding="utf-8")
 
 
+def _write_stream(target_path: Path, data: Any, opts: Dict[str, Any]) -> None:
+    target_path.parent.mkdir(parents=True, exist_ok=True)
+    with target_path.open("w", encoding="utf-8") as fp:
+        _render_to(fp, data, opts)
+
+
 def _ext(fmt: str) -> str:
     return ".yaml" if fmt == "yaml" else ".json"
 
@@ -9,11 +9,12 @@ from __future__ import annotations
 
 from typing import Dict, List
 
-from ..types import HclBlock, Value
+from ..types import HclBlock, NestedBlock, Value
 from ..utils.common.value_helpers import literal_string
 from ..utils.parser.body_parser import parse_block_body
 
-META_KEYS = {"count", "for_each", "provider", "depends_on", "lifecycle"}
+META_KEYS = frozenset({"count", "for_each", "provider", "depends_on", "lifecycle"})
+"""Resource attributes treated as Terraform meta-arguments rather than properties."""
 
 
 class TerraformSettingsParser:
@@ -52,14 +53,14 @@ class ProviderParser:
         """
         labels = block.get("labels", [])
         name = labels[0] if labels else "default"
-        parsed = parse_block_body(block["body"])
-        alias_value = parsed["attributes"].get("alias")
-        alias = literal_string(alias_value) or (alias_value.get("raw") if isinstance(alias_value, dict) else None)
+        attributes = parse_block_body(block["body"])["attributes"]
+        alias_value = attributes.get("alias")
+        alias = literal_string(alias_value) or (alias_value.get("raw") if alias_value else None)
 
         return {
             "name": name,
             "alias": alias,
-            "properties": parsed["attributes"],
+            "properties": attributes,
             "raw": block["raw"],
             "source": block["source"],
         }
@@ -107,77 +108,71 @@ class ResourceParser:
         """
         labels = block.get("labels", [])
         # Safe label extraction with fallbacks
-        resource_type = labels[0] if len(labels) > 0 else "unknown"
-        name = labels[1] if len(labels) > 1 else "unnamed"
+        label_count = len(labels)
+        resource_type = labels[0] if label_count else "unknown"
+        name = labels[1] if label_count > 1 else "unnamed"
         parsed = parse_block_body(block["body"])
 
-        meta: Dict[str, Value] = {}
-        properties: Dict[str, Value] = {}
+        attributes: Dict[str, Value] = parsed["attributes"]
+        meta_keys = attributes.keys() & META_KEYS
+
+        # Most resources carry no meta-arguments; reuse the parsed dict as-is then
+        if meta_keys:
+            meta = {key: value for key, value in attributes.items() if key in meta_keys}
+            properties = {key: value for key, value in attributes.items() if key not in meta_keys}
+        else:
+            meta = {}
+            properties = attributes
 
-        for key, value in parsed["attributes"].items():
-            if key in META_KEYS:
-                meta[key] = value
+        # Single pass over nested blocks, routing dynamic blocks to their own list
+        static_blocks: List[Dict[str, object]] = []
+        dynamic_blocks: List[Dict[str, object]] = []
+        for child in parsed["blocks"]:
+            if child.get("type") == "dynamic":
+                dynamic_blocks.append(self._parse_dynamic(child))
             else:
-                properties[key] = value
+                static_blocks.append(child)
 
         return {
             "type": resource_type,
             "name": name,
             "properties": properties,
-            "blocks": [b for b in parsed["blocks"] if b.get("type") != "dynamic"],
-            "dynamic_blocks": self._extract_dynamic_blocks(parsed["blocks"]),
+            "blocks": static_blocks,
+            "dynamic_blocks": dynamic_blocks,
             "meta": meta,
             "raw": block["raw"],
             "source": block["source"],
         }
 
-    def _extract_dynamic_blocks(self, blocks: List[Dict[str, object]]) -> List[Dict[str, object]]:
+    def _parse_dynamic(self, child: NestedBlock) -> Dict[str, object]:
         """
-        Extracts dynamic block definitions from nested blocks.
+        Parses a single dynamic block definition.
+
+        ``child`` comes from ``parse_block_body``, which always populates
+        ``labels`` (list), ``attributes`` (dict), and ``blocks`` (list), so
+        those keys are read directly.
 
         Args:
-            blocks: List of nested blocks.
+            child: A nested block whose type is ``dynamic``.
 
         Returns:
-            List of parsed dynamic block structures.
+            Parsed dynamic block structure.
         """
-        dynamic_blocks: List[Dict[str, object]] = []
+        labels = child["labels"]
+        attributes = child["attributes"]
 
-        for child in blocks:
-            if child.get("type") != "dynamic":
-                continue
+        iterator_value = attributes.get("iterator")
+        iterator = literal_string(iterator_value) if iterator_value else None
 
-            labels = child.get("labels")
-            if not isinstance(labels, list):
-                labels = []
-            label = labels[0] if labels else "dynamic"
+        content_block = next((nested for nested in child["blocks"] if nested["type"] == "content"), None)
 
-            attributes = child.get("attributes", {})
-            if not isinstance(attributes, dict):
-                attributes = {}
-
-            iterator_value = attributes.get("iterator")
-            iterator = literal_string(iterator_value) if isinstance(iterator_value, dict) else None
-
-            content_block = None
-            nested_blocks = child.get("blocks", [])
-            if isinstance(nested_blocks, list):
-                for nested in nested_blocks:
-                    if isinstance(nested, dict) and nested.get("type") == "content":
-                        content_block = nested
-                        break
-
-            dynamic_blocks.append(
-                {
-                    "label": label,
-                    "for_each": attributes.get("for_each"),
-                    "iterator": iterator,
-                    "content": content_block.get("attributes", {}) if content_block else {},
-                    "raw": child.get("raw"),
-                }
-            )
-
-        return dynamic_blocks
+        return {
+            "label": labels[0] if labels else "dynamic",
+            "for_each": attributes.get("for_each"),
+            "iterator": iterator,
+            "content": content_block["attributes"] if content_block else {},
+            "raw": child["raw"],
+        }
 
 
 class DataParser:
@@ -195,8 +190,9 @@ class DataParser:
         """
         labels = block.get("labels", [])
         # Safe label extraction with fallbacks
-        data_type = labels[0] if len(labels) > 0 else "unknown"
-        name = labels[1] if len(labels) > 1 else "unnamed"
+        label_count = len(labels)
+        data_type = labels[0] if label_count else "unknown"
+        name = labels[1] if label_count > 1 else "unnamed"
         parsed = parse_block_body(block["body"])
 
         return {
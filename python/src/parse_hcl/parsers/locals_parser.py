@@ -3,22 +3,25 @@ from __future__ import annotations
 from typing import Dict, List
 
 from ..types import HclBlock
-from ..utils.parser.body_parser import parse_block_body
+from ..utils.parser.body_parser import parse_block_body_cached
 
 
 class LocalsParser:
     def parse(self, block: HclBlock) -> List[Dict[str, object]]:
-        parsed = parse_block_body(block["body"])
+        attributes = parse_block_body_cached(block["body"])["attributes"]
+        source = block["source"]
         locals_list: List[Dict[str, object]] = []
+        append = locals_list.append
 
-        for name, value in parsed["attributes"].items():  # type: ignore[index]
-            locals_list.append(
+        for name, value in attributes.items():  # type: ignore[attr-defined]
+            is_dict = isinstance(value, dict)
+            append(
                 {
                     "name": name,
-                    "type": value.get("type") if isinstance(value, dict) else None,
+                    "type": value.get("type") if is_dict else None,
                     "value": value,
-                    "raw": value.get("raw") if isinstance(value, dict) else None,
-                    "source": block["source"],
+                    "raw": value.get("raw") if is_dict else None,
+                    "source": source,
                 }
             )
 
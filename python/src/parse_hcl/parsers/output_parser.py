@@ -4,18 +4,20 @@ from typing import Dict
 
 from ..types import HclBlock
 from ..utils.common.value_helpers import literal_boolean, literal_string
-from ..utils.parser.body_parser import parse_block_body
+from ..utils.parser.body_parser import parse_block_body_cached
 
 
 class OutputParser:
     def parse(self, block: HclBlock) -> Dict[str, object]:
         name = block["labels"][0] if block["labels"] else "unknown"
-        parsed = parse_block_body(block["body"])
+        get_attr = parse_block_body_cached(block["body"])["attributes"].get  # type: ignore[index]
 
-        description_val = parsed["attributes"].get("description")  # type: ignore[index]
-        description = literal_string(description_val) or (description_val.get("raw") if isinstance(description_val, dict) else None)
-        value = parsed["attributes"].get("value")  # type: ignore[index]
-        sensitive = literal_boolean(parsed["attributes"].get("sensitive"))  # type: ignore[index]
+        # Optional attributes are usually absent, so skip the literal_* helpers for missing ones
+        description_val = get_attr("description")
+        description = (literal_string(description_val) or description_val.get("raw")) if isinstance(description_val, dict) else None
+        value = get_attr("value")
+        sensitive_val = get_attr("sensitive")
+        sensitive = literal_boolean(sensitive_val) if sensitive_val is not None else None
 
         return {
             "name": name,
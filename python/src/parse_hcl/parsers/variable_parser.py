@@ -7,17 +7,34 @@ Extracts variable declarations with type constraints, defaults, and validations.
 from __future__ import annotations
 
 import re
+from functools import lru_cache
 from typing import Any, Dict, List, Optional, Tuple
 
 from ..types import HclBlock, TypeConstraint, Value, VariableValidation
 from ..utils.common.value_helpers import literal_boolean, literal_string
-from ..utils.parser.body_parser import parse_block_body
+from ..utils.parser.body_parser import parse_block_body_cached
 
 # Regex patterns for type constraint parsing (matches TypeScript implementation)
 COLLECTION_PATTERN = re.compile(r"^(list|set|map)\s*\(\s*([\s\S]*)\s*\)$")
 OPTIONAL_PATTERN = re.compile(r"^optional\s*\(\s*([\s\S]*)\s*\)$")
 TUPLE_PATTERN = re.compile(r"^tuple\s*\(\s*\[([\s\S]*)\]\s*\)$")
 OBJECT_PATTERN = re.compile(r"^object\s*\(\s*\{([\s\S]*)\}\s*\)$")
+OBJECT_ATTR_PATTERN = re.compile(r"^(\w+)\s*=\s*([\s\S]+)$")
+DELIMITER_PATTERN = re.compile(r"[(){}\[\],]")
+BRACKET_PATTERN = re.compile(r"[(){}\[\]]")
+
+PRIMITIVE_TYPES = frozenset({"string", "number", "bool", "any"})
+"""Primitive Terraform type names, returned without running any regex."""
+
+TYPE_KEYWORD_PATTERNS = {
+    "list": COLLECTION_PATTERN,
+    "set": COLLECTION_PATTERN,
+    "map": COLLECTION_PATTERN,
+    "optional": OPTIONAL_PATTERN,
+    "tuple": TUPLE_PATTERN,
+    "object": OBJECT_PATTERN,
+}
+"""Structural type keyword to the pattern that parses it."""
 
 
 class VariableParser:
@@ -57,14 +74,18 @@ class VariableParser:
             - nullable: Whether the variable is nullable
         """
         name = block["labels"][0] if block["labels"] else "unknown"
-        parsed = parse_block_body(block["body"])
-
-        description_val = parsed["attributes"].get("description")  # type: ignore[index]
-        description = literal_string(description_val) or (description_val.get("raw") if isinstance(description_val, dict) else None)
-        type_val = parsed["attributes"].get("type")  # type: ignore[index]
-        type_raw = literal_string(type_val) or (type_val.get("raw") if isinstance(type_val, dict) else None)
-        sensitive = literal_boolean(parsed["attributes"].get("sensitive"))  # type: ignore[index]
-        nullable = literal_boolean(parsed["attributes"].get("nullable"))  # type: ignore[index]
+        parsed = parse_block_body_cached(block["body"])
+        get_attr = parsed["attributes"].get  # type: ignore[index]
+
+        # Most attributes are usually absent, so skip the literal_* helpers for missing ones
+        description_val = get_attr("description")
+        description = (literal_string(description_val) or description_val.get("raw")) if isinstance(description_val, dict) else None
+        type_val = get_attr("type")
+        type_raw = (literal_string(type_val) or type_val.get("raw")) if isinstance(type_val, dict) else None
+        sensitive_val = get_attr("sensitive")
+        sensitive = literal_boolean(sensitive_val) if sensitive_val is not None else None
+        nullable_val = get_attr("nullable")
+        nullable = literal_boolean(nullable_val) if nullable_val is not None else None
         validation = self._extract_validation(parsed["blocks"])  # type: ignore[arg-type]
         type_constraint = parse_type_constraint(type_raw) if type_raw else None
 
@@ -73,7 +94,7 @@ class VariableParser:
             "description": description,
             "type": type_raw,
             "typeConstraint": type_constraint,
-            "default": parsed["attributes"].get("default"),  # type: ignore[index]
+            "default": get_attr("default"),
             "validation": validation,
             "sensitive": sensitive,
             "nullable": nullable,
@@ -96,8 +117,10 @@ class VariableParser:
             return None
 
         attrs = validation_block.get("attributes", {})
-        condition = attrs.get("condition") if isinstance(attrs, dict) else None
-        error_message = attrs.get("error_message") if isinstance(attrs, dict) else None
+        if not isinstance(attrs, dict):
+            attrs = {}
+        condition = attrs.get("condition")
+        error_message = attrs.get("error_message")
 
         if not condition and not error_message:
             return None
@@ -136,36 +159,55 @@ def parse_type_constraint(raw: str) -> TypeConstraint:
         >>> parse_type_constraint('tuple([string, number])')
         {'base': 'tuple', 'elements': [...], 'raw': 'tuple([string, number])'}
     """
-    trimmed = raw.strip()
-    primitives = {"string", "number", "bool", "any"}
+    # Results are memoized per type string; hand out a copy so callers may mutate it
+    return _copy_constraint(_parse_type_constraint_cached(raw.strip()))
+
+
+@lru_cache(maxsize=4096)
+def _parse_type_constraint_cached(trimmed: str) -> TypeConstraint:
+    """
+    Parses a trimmed type constraint expression, memoized on the string.
 
-    if trimmed in primitives:
+    The returned structure is shared between callers and must not be mutated;
+    use parse_type_constraint for a private copy.
+
+    Args:
+        trimmed: The whitespace-trimmed type expression.
+
+    Returns:
+        Parsed TypeConstraint.
+    """
+    if trimmed in PRIMITIVE_TYPES:
+        return {"base": trimmed, "raw": trimmed}
+
+    # Each structural pattern starts with a fixed keyword followed by "(", so the
+    # keyword alone selects the only regex that can match
+    paren = trimmed.find("(")
+    pattern = TYPE_KEYWORD_PATTERNS.get(trimmed[:paren].strip()) if paren > 0 else None
+    match = pattern.match(trimmed) if pattern is not None else None
+    if match is None:
         return {"base": trimmed, "raw": trimmed}
 
-    # Check for collection types: list(T), set(T), map(T) - using regex for whitespace
-    collection_match = COLLECTION_PATTERN.match(trimmed)
-    if collection_match:
-        base, inner = collection_match.groups()
+    # Collection types: list(T), set(T), map(T) - using regex for whitespace
+    if pattern is COLLECTION_PATTERN:
+        base, inner = match.groups()
         return {
             "base": base,
-            "element": parse_type_constraint(inner.strip()),
+            "element": _parse_type_constraint_cached(inner.strip()),
             "raw": trimmed,
         }
 
-    # Check for optional(T) - using regex for whitespace
-    optional_match = OPTIONAL_PATTERN.match(trimmed)
-    if optional_match:
-        inner = parse_type_constraint(optional_match.group(1).strip())
+    # optional(T) - using regex for whitespace
+    if pattern is OPTIONAL_PATTERN:
+        inner = _parse_type_constraint_cached(match.group(1).strip())
         result = dict(inner)
         result["optional"] = True
         result["raw"] = trimmed
         return result  # type: ignore[return-value]
 
-    # Check for tuple([T1, T2, ...]) - preserve element types
-    tuple_match = TUPLE_PATTERN.match(trimmed)
-    if tuple_match:
-        inner_content = tuple_match.group(1).strip()
-        elements = _parse_tuple_elements(inner_content)
+    # tuple([T1, T2, ...]) - preserve element types
+    if pattern is TUPLE_PATTERN:
+        elements = _parse_tuple_elements(match.group(1).strip())
         result: TypeConstraint = {
             "base": "tuple",
             "raw": trimmed,
@@ -174,69 +216,104 @@ def parse_type_constraint(raw: str) -> TypeConstraint:
             result["elements"] = elements  # type: ignore[typeddict-unknown-key]
         return result
 
-    # Check for object({ attr = type, ... }) - using regex for whitespace
-    object_match = OBJECT_PATTERN.match(trimmed)
-    if object_match:
-        inner_content = object_match.group(1)
-        attributes = _parse_object_type_attributes(inner_content)
-        result = {
-            "base": "object",
-            "raw": trimmed,
-        }
-        if attributes:
-            result["attributes"] = attributes
-        return result
+    # object({ attr = type, ... }) - using regex for whitespace
+    attributes = _parse_object_type_attributes(match.group(1))
+    result = {
+        "base": "object",
+        "raw": trimmed,
+    }
+    if attributes:
+        result["attributes"] = attributes
+    return result
 
-    # Default: treat as unknown/complex type expression
-    return {"base": trimmed, "raw": trimmed}
 
+def _copy_constraint(constraint: TypeConstraint) -> TypeConstraint:
+    """
+    Copies a TypeConstraint along with its nested element/attribute constraints.
 
-def _parse_tuple_elements(inner: str) -> List[TypeConstraint]:
+    Args:
+        constraint: The constraint to copy.
+
+    Returns:
+        A structurally independent copy.
     """
-    Parses tuple element types from the inner content of a tuple type.
+    copied: Dict[str, Any] = dict(constraint)
+    element = copied.get("element")
+    if element is not None:
+        copied["element"] = _copy_constraint(element)
+    elements = copied.get("elements")
+    if elements is not None:
+        copied["elements"] = [_copy_constraint(item) for item in elements]
+    attributes = copied.get("attributes")
+    if attributes is not None:
+        copied["attributes"] = {name: _copy_constraint(attr) for name, attr in attributes.items()}
+    return copied  # type: ignore[return-value]
+
+
+def _split_top_level_commas(text: str) -> List[str]:
+    """
+    Splits text on commas that are not nested inside brackets.
 
-    Handles nested types correctly by tracking bracket depth.
+    Only delimiter characters are visited (via a regex scan), and entries
+    are sliced straight from the input rather than rebuilt per character.
 
     Args:
-        inner: The content inside tuple([ ... ]).
+        text: The text to split.
 
     Returns:
-        List of TypeConstraint for each element.
+        Non-empty, whitespace-trimmed entries.
     """
-    elements: List[TypeConstraint] = []
-    trimmed = inner.strip()
-
-    if not trimmed:
-        return elements
+    if not BRACKET_PATTERN.search(text):
+        # Flat lists such as "string, number" need no depth tracking
+        return [entry for entry in (part.strip() for part in text.split(",")) if entry]
 
-    # Split by commas, respecting nested structures
-    depth = 0
-    current: List[str] = []
     entries: List[str] = []
+    depth = 0
+    start = 0
 
-    for char in trimmed:
+    for match in DELIMITER_PATTERN.finditer(text):
+        char = match.group()
         if char in "({[":
             depth += 1
-            current.append(char)
-        elif char in ")}]":
+        elif char != ",":
             depth -= 1
-            current.append(char)
-        elif char == "," and depth == 0:
-            entry = "".join(current).strip()
+        elif depth == 0:
+            entry = text[start : match.start()].strip()
             if entry:
                 entries.append(entry)
-            current = []
-        else:
-            current.append(char)
+            start = match.end()
 
     # Don't forget the last entry
-    final = "".join(current).strip()
+    final = text[start:].strip()
     if final:
         entries.append(final)
 
+    return entries
+
+
+def _parse_tuple_elements(inner: str) -> List[TypeConstraint]:
+    """
+    Parses tuple element types from the inner content of a tuple type.
+
+    Handles nested types correctly by tracking bracket depth.
+
+    Args:
+        inner: The content inside tuple([ ... ]).
+
+    Returns:
+        List of TypeConstraint for each element.
+    """
+    elements: List[TypeConstraint] = []
+    trimmed = inner.strip()
+
+    if not trimmed:
+        return elements
+
+    entries = _split_top_level_commas(trimmed)
+
     # Parse each element type
     for entry in entries:
-        elements.append(parse_type_constraint(entry))
+        elements.append(_parse_type_constraint_cached(entry))
 
     return elements
 
@@ -259,36 +336,13 @@ def _parse_object_type_attributes(inner: str) -> Dict[str, TypeConstraint]:
     if not trimmed:
         return attributes
 
-    # Split by commas, respecting nested structures
-    depth = 0
-    current: List[str] = []
-    entries: List[str] = []
-
-    for char in trimmed:
-        if char in "({[":
-            depth += 1
-            current.append(char)
-        elif char in ")}]":
-            depth -= 1
-            current.append(char)
-        elif char == "," and depth == 0:
-            entry = "".join(current).strip()
-            if entry:
-                entries.append(entry)
-            current = []
-        else:
-            current.append(char)
-
-    # Don't forget the last entry
-    final = "".join(current).strip()
-    if final:
-        entries.append(final)
+    entries = _split_top_level_commas(trimmed)
 
     # Parse each entry (format: "name = type")
     for entry in entries:
-        match = re.match(r"^(\w+)\s*=\s*([\s\S]+)$", entry)
+        match = OBJECT_ATTR_PATTERN.match(entry)
         if match:
             attr_name, attr_type = match.groups()
-            attributes[attr_name] = parse_type_constraint(attr_type.strip())
+            attributes[attr_name] = _parse_type_constraint_cached(attr_type.strip())
 
     return attributes
@@ -1,12 +1,26 @@
 from __future__ import annotations
 
-from typing import Any, Dict
-
-from ..types import Value
+import os
+from sys import intern
+from typing import Any, Dict, List, Optional, Tuple
+
+from ..types import (
+    PlanModule,
+    PlanResource,
+    PlanResourceChange,
+    TerraformStateInstance,
+    TerraformStateOutput,
+    TerraformStateResource,
+    Value,
+)
 from ..utils.parser.body_parser import parse_block_body
 from ..utils.common.fs import read_json_file, read_text_file
+from ..utils.common.json_codec import dumps, load_streaming
 from .terraform_json_parser import _convert_json_value
 
+STATE_STREAM_MIN_BYTES = 8 * 1024 * 1024
+"""State files at least this large are decoded incrementally when include_raw is False."""
+
 
 class TfVarsParser:
     def parse_file(self, file_path: str) -> Dict[str, Any]:
@@ -21,25 +35,41 @@ class TfVarsParser:
 
 
 class TfStateParser:
-    def parse_file(self, file_path: str) -> Dict[str, Any]:
+    def parse_file(self, file_path: str, include_raw: bool = True) -> Dict[str, Any]:
+        if not include_raw and os.path.getsize(file_path) >= STATE_STREAM_MIN_BYTES:
+            # Nothing needs the input tree afterwards, so normalize resources while decoding
+            data = load_streaming(file_path, "resources", self._normalize_state_resource)
+            return self._build(data, file_path, include_raw=False, normalized=True)
         raw = read_json_file(file_path)
-        return self.parse(raw, file_path)
+        return self.parse(raw, file_path, include_raw=include_raw)
+
+    def parse(self, raw: Any, source: str = "", include_raw: bool = True) -> Dict[str, Any]:
+        return self._build(raw, source, include_raw=include_raw, normalized=False)
 
-    def parse(self, raw: Any, source: str = "") -> Dict[str, Any]:
+    def _build(self, raw: Any, source: str, include_raw: bool, normalized: bool) -> Dict[str, Any]:
         data = raw or {}
         if not isinstance(data, dict):
             data = {}
         resources_raw = data.get("resources", [])
-        resources = [self._normalize_state_resource(item) for item in resources_raw] if isinstance(resources_raw, list) else []
+        if not isinstance(resources_raw, list):
+            resources = []
+        elif normalized:
+            resources = resources_raw
+        else:
+            resources = [self._normalize_state_resource(item) for item in resources_raw]
         outputs = _normalize_state_outputs(data.get("outputs") or {})
 
-        version = data.get("version")
-        terraform_version = data.get("terraform_version") if isinstance(data.get("terraform_version"), str) else None
-        serial = data.get("serial") if isinstance(data.get("serial"), int) else None
-        lineage = data.get("lineage") if isinstance(data.get("lineage"), str) else None
+        get = data.get
+        version = get("version")
+        terraform_version = get("terraform_version")
+        terraform_version = terraform_version if isinstance(terraform_version, str) else None
+        serial = get("serial")
+        serial = serial if isinstance(serial, int) else None
+        lineage = get("lineage")
+        lineage = lineage if isinstance(lineage, str) else None
         version_num = version if isinstance(version, int) else int(version) if isinstance(version, str) and version.isdigit() else 0
 
-        return {
+        result: Dict[str, Any] = {
             "version": version_num,
             "terraform_version": terraform_version,
             "serial": serial,
@@ -49,39 +79,51 @@ class TfStateParser:
             "raw": raw,
             "source": source,
         }
+        if not include_raw:
+            # Avoid pinning the whole input tree in the result
+            del result["raw"]
+        return result
 
-    def _normalize_state_resource(self, resource: Any) -> Dict[str, Any]:
+    def _normalize_state_resource(self, resource: Any) -> TerraformStateResource:
         data = resource or {}
         if not isinstance(data, dict):
             data = {}
-        instances_raw = data.get("instances", [])
+        get = data.get
+        instances_raw = get("instances", [])
         instances = [_normalize_state_instance(item) for item in instances_raw] if isinstance(instances_raw, list) else []
+        resource_type = _interned(get("type"))
+        name = get("name")
 
+        # Module, type, provider and status values repeat across thousands of
+        # resources; interning keeps one shared copy of each
         return {
-            "module": data.get("module") if isinstance(data.get("module"), str) else None,
-            "mode": "data" if data.get("mode") == "data" else "managed",
-            "type": data.get("type") if isinstance(data.get("type"), str) else "unknown",
-            "name": data.get("name") if isinstance(data.get("name"), str) else "unknown",
-            "provider": data.get("provider") if isinstance(data.get("provider"), str) else None,
+            "module": _interned(get("module")),
+            "mode": "data" if get("mode") == "data" else "managed",
+            "type": resource_type if resource_type is not None else "unknown",
+            "name": name if isinstance(name, str) else "unknown",
+            "provider": _interned(get("provider")),
             "instances": instances,
         }
 
 
 class TfPlanParser:
-    def parse_file(self, file_path: str) -> Dict[str, Any]:
+    def parse_file(self, file_path: str, include_raw: bool = True) -> Dict[str, Any]:
         raw = read_json_file(file_path)
-        return self.parse(raw, file_path)
+        return self.parse(raw, file_path, include_raw=include_raw)
 
-    def parse(self, raw: Any, source: str = "") -> Dict[str, Any]:
+    def parse(self, raw: Any, source: str = "", include_raw: bool = True) -> Dict[str, Any]:
         data = raw or {}
         if not isinstance(data, dict):
             data = {}
-        planned_values = data.get("planned_values")
-        resource_changes = data.get("resource_changes", [])
+        get = data.get
+        planned_values = get("planned_values")
+        resource_changes = get("resource_changes", [])
+        format_version = get("format_version")
+        terraform_version = get("terraform_version")
 
         result: Dict[str, Any] = {
-            "format_version": data.get("format_version") if isinstance(data.get("format_version"), str) else None,
-            "terraform_version": data.get("terraform_version") if isinstance(data.get("terraform_version"), str) else None,
+            "format_version": format_version if isinstance(format_version, str) else None,
+            "terraform_version": terraform_version if isinstance(terraform_version, str) else None,
             "planned_values": None,
             "resource_changes": [],
             "raw": raw,
@@ -89,103 +131,148 @@ class TfPlanParser:
         }
 
         if isinstance(planned_values, dict):
-            root_module = planned_values.get("root_module") if isinstance(planned_values.get("root_module"), dict) else {}
+            root_module = planned_values.get("root_module")
+            root_module = root_module if isinstance(root_module, dict) else {}
             result["planned_values"] = {"root_module": _normalize_plan_module(root_module)}
 
         if isinstance(resource_changes, list):
             result["resource_changes"] = [_normalize_plan_resource_change(item) for item in resource_changes]
 
+        if not include_raw:
+            # Avoid pinning the whole input tree in the result
+            del result["raw"]
         return result
 
 
-def _normalize_state_outputs(outputs: Dict[str, Any]) -> Dict[str, Any]:
-    result: Dict[str, Any] = {}
+def _normalize_state_outputs(outputs: Dict[str, Any]) -> Dict[str, TerraformStateOutput]:
+    result: Dict[str, TerraformStateOutput] = {}
     for name, value in outputs.items():
         output = value if isinstance(value, dict) else {}
         result[name] = {"value": output.get("value", value), "type": output.get("type"), "sensitive": bool(output.get("sensitive"))}
     return result
 
 
-def _normalize_state_instance(instance: Any) -> Dict[str, Any]:
+def _normalize_state_instance(instance: Any) -> TerraformStateInstance:
     data = instance or {}
     if not isinstance(data, dict):
         data = {}
-    index_key = None
-    if isinstance(data.get("index_key"), (str, int)):
-        index_key = data["index_key"]
-    elif isinstance(data.get("index"), (str, int)):
-        index_key = data["index"]
-
-    attributes = data.get("attributes") or data.get("attributes_flat")
+    get = data.get
+    index_key = get("index_key")
+    if not isinstance(index_key, (str, int)):
+        index_key = get("index")
+        if not isinstance(index_key, (str, int)):
+            index_key = None
+
+    attributes = get("attributes") or get("attributes_flat")
     attributes = attributes if isinstance(attributes, dict) else None
+    status = get("status")
 
-    return {"index_key": index_key, "attributes": attributes, "status": data.get("status") if isinstance(data.get("status"), str) else None}
+    return {"index_key": index_key, "attributes": attributes, "status": _interned(status)}
 
 
-def _normalize_plan_module(module: Dict[str, Any]) -> Dict[str, Any]:
-    resources_raw = module.get("resources", [])
-    children_raw = module.get("child_modules", [])
+def _normalize_plan_module(module: Dict[str, Any]) -> PlanModule:
+    # Walk child modules with an explicit stack; each entry pairs a normalized
+    # module's child list with the raw children still to be filled into it
+    root, children_raw = _plan_module_node(module)
+    stack: List[Tuple[List[PlanModule], List[Any]]] = [(root["child_modules"], children_raw)]  # type: ignore[list-item]
+    while stack:
+        siblings, pending = stack.pop()
+        for child in pending:
+            node, grandchildren = _plan_module_node(child)
+            siblings.append(node)
+            if grandchildren:
+                stack.append((node["child_modules"], grandchildren))  # type: ignore[arg-type]
+    return root
 
-    resources = [_normalize_plan_resource(r) for r in resources_raw] if isinstance(resources_raw, list) else []
-    children = [_normalize_plan_module(child) for child in children_raw] if isinstance(children_raw, list) else []
 
-    return {
-        "address": module.get("address") if isinstance(module.get("address"), str) else None,
+def _plan_module_node(module: Dict[str, Any]) -> Tuple[PlanModule, List[Any]]:
+    get = module.get
+    resources_raw = get("resources", [])
+    children_raw = get("child_modules", [])
+    address = get("address")
+
+    resources = [_normalize_plan_resource(r) for r in resources_raw] if isinstance(resources_raw, list) else []
+    node: PlanModule = {
+        "address": address if isinstance(address, str) else None,
         "resources": resources,
-        "child_modules": children,
+        "child_modules": [],
     }
+    return node, children_raw if isinstance(children_raw, list) else []
 
 
-def _normalize_plan_resource(resource: Any) -> Dict[str, Any]:
+def _normalize_plan_resource(resource: Any) -> PlanResource:
     data = resource or {}
     if not isinstance(data, dict):
         data = {}
-    address = data.get("address") if isinstance(data.get("address"), str) else None
+    get = data.get
+    address = get("address")
+    resource_type = _interned(get("type"))
+    name = get("name")
+    values = get("values")
 
     return {
-        "address": address or _build_address(data),
-        "mode": "data" if data.get("mode") == "data" else "managed",
-        "type": data.get("type") if isinstance(data.get("type"), str) else "unknown",
-        "name": data.get("name") if isinstance(data.get("name"), str) else "unknown",
-        "provider_name": data.get("provider_name") if isinstance(data.get("provider_name"), str) else None,
-        "values": data.get("values") if isinstance(data.get("values"), dict) else None,
+        "address": (address if isinstance(address, str) else None) or _build_address(data),
+        "mode": "data" if get("mode") == "data" else "managed",
+        "type": resource_type if resource_type is not None else "unknown",
+        "name": name if isinstance(name, str) else "unknown",
+        "provider_name": _interned(get("provider_name")),
+        "values": values if isinstance(values, dict) else None,
     }
 
 
-def _normalize_plan_resource_change(change: Any) -> Dict[str, Any]:
+def _normalize_plan_resource_change(change: Any) -> PlanResourceChange:
     data = change or {}
     if not isinstance(data, dict):
         data = {}
-    change_data = data.get("change") if isinstance(data.get("change"), dict) else {}
+    get = data.get
+    change_data = get("change")
+    change_data = change_data if isinstance(change_data, dict) else {}
+    address = get("address")
+    module_address = get("module_address")
+    resource_type = _interned(get("type"))
+    name = get("name")
+
+    change_get = change_data.get
+    actions = change_get("actions")
+    after_unknown = change_get("after_unknown")
+    before_sensitive = change_get("before_sensitive")
+    after_sensitive = change_get("after_sensitive")
 
     return {
-        "address": data.get("address") if isinstance(data.get("address"), str) else _build_address(data),
-        "module_address": data.get("module_address") if isinstance(data.get("module_address"), str) else None,
-        "mode": "data" if data.get("mode") == "data" else "managed",
-        "type": data.get("type") if isinstance(data.get("type"), str) else "unknown",
-        "name": data.get("name") if isinstance(data.get("name"), str) else "unknown",
-        "provider_name": data.get("provider_name") if isinstance(data.get("provider_name"), str) else None,
+        "address": address if isinstance(address, str) else _build_address(data),
+        "module_address": module_address if isinstance(module_address, str) else None,
+        "mode": "data" if get("mode") == "data" else "managed",
+        "type": resource_type if resource_type is not None else "unknown",
+        "name": name if isinstance(name, str) else "unknown",
+        "provider_name": _interned(get("provider_name")),
         "change": {
-            "actions": change_data.get("actions") if isinstance(change_data.get("actions"), list) else [],
-            "before": change_data.get("before"),
-            "after": change_data.get("after"),
-            "after_unknown": change_data.get("after_unknown") if isinstance(change_data.get("after_unknown"), dict) else None,
-            "before_sensitive": change_data.get("before_sensitive") if isinstance(change_data.get("before_sensitive"), dict) else None,
-            "after_sensitive": change_data.get("after_sensitive") if isinstance(change_data.get("after_sensitive"), dict) else None,
+            "actions": actions if isinstance(actions, list) else [],
+            "before": change_get("before"),
+            "after": change_get("after"),
+            "after_unknown": after_unknown if isinstance(after_unknown, dict) else None,
+            "before_sensitive": before_sensitive if isinstance(before_sensitive, dict) else None,
+            "after_sensitive": after_sensitive if isinstance(after_sensitive, dict) else None,
         },
     }
 
 
 def _build_address(data: Dict[str, Any]) -> str:
-    mode = "data" if data.get("mode") == "data" else "resource"
-    resource_type = data.get("type") if isinstance(data.get("type"), str) else "unknown"
-    name = data.get("name") if isinstance(data.get("name"), str) else "unknown"
+    get = data.get
+    mode = "data" if get("mode") == "data" else "resource"
+    resource_type = get("type")
+    resource_type = resource_type if isinstance(resource_type, str) else "unknown"
+    name = get("name")
+    name = name if isinstance(name, str) else "unknown"
     return f"{mode}.{resource_type}.{name}"
 
 
+def _interned(value: Any) -> Optional[str]:
+    """Returns a string value, interned when it is an exact str (sys.intern rejects subclasses), or None."""
+    if type(value) is str:
+        return intern(value)
+    return value if isinstance(value, str) else None
+
+
 def _stringify(value: Any) -> str:
-    try:
-        import json
-        return json.dumps(value)
-    except Exception:
-        return str(value)
+    # Only called with freshly decoded JSON, which always re-encodes
+    return dumps(value)
@@ -1,12 +1,16 @@
 from __future__ import annotations
 
 import json
-import re
-from typing import Any, Dict
+from json.encoder import INFINITY, encode_basestring_ascii
+from sys import intern
+from typing import Any, Dict, Iterator, List, Optional, Tuple
 
 from ..types import TerraformDocument, Value, create_empty_document
 from ..utils.common.fs import read_json_file
-from ..utils.parser.value_classifier import classify_value
+from ..utils.parser.value_classifier import classify_value_cached
+
+_MISSING = object()
+"""Sentinel for config keys that are absent (as opposed to set to null)."""
 
 
 class TerraformJsonParser:
@@ -31,7 +35,8 @@ class TerraformJsonParser:
             return
         for item in value:
             if isinstance(item, dict):
-                doc["terraform"].append({"properties": _convert_attributes(item), "raw": _stringify(item), "source": source})
+                properties, raw = _convert_attributes(item)
+                doc["terraform"].append({"properties": properties, "raw": raw, "source": source})
 
     def _parse_providers(self, value: Any, doc: TerraformDocument, source: str) -> None:
         if not isinstance(value, dict):
@@ -41,13 +46,14 @@ class TerraformJsonParser:
             for alias_cfg in configs:
                 if not isinstance(alias_cfg, dict):
                     continue
-                alias = alias_cfg.get("alias") if isinstance(alias_cfg.get("alias"), str) else None
+                alias = alias_cfg.get("alias")
+                properties, raw = _convert_attributes(alias_cfg, skip_keys={"alias"})
                 doc["provider"].append(
                     {
                         "name": name,
-                        "alias": alias,
-                        "properties": _convert_attributes(alias_cfg, skip_keys={"alias"}),
-                        "raw": _stringify(alias_cfg),
+                        "alias": alias if isinstance(alias, str) else None,
+                        "properties": properties,
+                        "raw": raw,
                         "source": source,
                     }
                 )
@@ -59,14 +65,19 @@ class TerraformJsonParser:
             cfg = config or {}
             if not isinstance(cfg, dict):
                 continue
+            get = cfg.get
+            description = get("description")
+            type_raw = get("type")
+            default = get("default", _MISSING)
+            sensitive = get("sensitive")
             doc["variable"].append(
                 {
                     "name": name,
-                    "description": cfg.get("description") if isinstance(cfg.get("description"), str) else None,
-                    "type": cfg.get("type") if isinstance(cfg.get("type"), str) else None,
-                    "default": _convert_json_value(cfg["default"]) if "default" in cfg else None,
+                    "description": description if isinstance(description, str) else None,
+                    "type": type_raw if isinstance(type_raw, str) else None,
+                    "default": _convert_json_value(default) if default is not _MISSING else None,
                     "validation": None,
-                    "sensitive": cfg.get("sensitive") if isinstance(cfg.get("sensitive"), bool) else None,
+                    "sensitive": sensitive if isinstance(sensitive, bool) else None,
                     "raw": _stringify(cfg),
                     "source": source,
                 }
@@ -79,12 +90,15 @@ class TerraformJsonParser:
             cfg = config or {}
             if not isinstance(cfg, dict):
                 continue
+            get = cfg.get
+            description = get("description")
+            sensitive = get("sensitive")
             doc["output"].append(
                 {
                     "name": name,
-                    "description": cfg.get("description") if isinstance(cfg.get("description"), str) else None,
-                    "value": _convert_json_value(cfg.get("value")),
-                    "sensitive": cfg.get("sensitive") if isinstance(cfg.get("sensitive"), bool) else None,
+                    "description": description if isinstance(description, str) else None,
+                    "value": _convert_json_value(get("value")),
+                    "sensitive": sensitive if isinstance(sensitive, bool) else None,
                     "raw": _stringify(cfg),
                     "source": source,
                 }
@@ -104,7 +118,8 @@ class TerraformJsonParser:
             cfg = config or {}
             if not isinstance(cfg, dict):
                 continue
-            doc["module"].append({"name": name, "properties": _convert_attributes(cfg), "raw": _stringify(cfg), "source": source})
+            properties, raw = _convert_attributes(cfg)
+            doc["module"].append({"name": name, "properties": properties, "raw": raw, "source": source})
 
     def _parse_resources(self, value: Any, doc: TerraformDocument, source: str) -> None:
         if not isinstance(value, dict):
@@ -117,7 +132,7 @@ class TerraformJsonParser:
                 for cfg in configs:
                     if not isinstance(cfg, dict):
                         continue
-                    parsed = _convert_attributes(cfg)
+                    parsed, raw = _convert_attributes(cfg)
                     doc["resource"].append(
                         {
                             "type": resource_type,
@@ -126,7 +141,7 @@ class TerraformJsonParser:
                             "blocks": [],
                             "dynamic_blocks": [],
                             "meta": {},
-                            "raw": _stringify(cfg),
+                            "raw": raw,
                             "source": source,
                         }
                     )
@@ -142,42 +157,177 @@ class TerraformJsonParser:
                 for cfg in configs:
                     if not isinstance(cfg, dict):
                         continue
-                    parsed = _convert_attributes(cfg)
+                    parsed, raw = _convert_attributes(cfg)
                     doc["data"].append(
                         {
                             "dataType": data_type,
                             "name": name,
                             "properties": parsed,
                             "blocks": [],
-                            "raw": _stringify(cfg),
+                            "raw": raw,
                             "source": source,
                         }
                     )
 
 
-def _convert_attributes(obj: Dict[str, Any], skip_keys: set[str] | None = None) -> Dict[str, Value]:
-    skip_keys = skip_keys or set()
-    return {key: _convert_json_value(val) for key, val in obj.items() if key not in skip_keys}
+def _convert_attributes(obj: Dict[str, Any], skip_keys: set[str] | None = None) -> Tuple[Dict[str, Value], str]:
+    """Converts a config object's attributes and returns its JSON text (skipped keys included) alongside."""
+    attributes, text = _convert_object(obj, skip_keys)
+    return attributes, text if text is not None else _stringify(obj)
 
 
 def _convert_json_value(input_val: Any) -> Value:
+    return _convert_with_raw(input_val)[0]
+
+
+def _convert_with_raw(input_val: Any) -> Tuple[Value, Optional[str]]:
+    """
+    Converts a decoded JSON value into a Value, also returning its JSON text.
+
+    Composite values assemble their ``raw`` text from their children's JSON
+    text, so each subtree is encoded once instead of once per enclosing level.
+    The text matches ``json.dumps`` output, or is None when the value is not
+    plain JSON data (callers then fall back to ``_stringify``).
+    """
+    if isinstance(input_val, (list, dict)):
+        converted, raw = _convert_container(input_val, None)
+        return _composite_value(input_val, converted, raw), raw
+    return _convert_scalar(input_val)
+
+
+def _convert_object(obj: Dict[str, Any], skip_keys: set[str] | None) -> Tuple[Dict[str, Value], Optional[str]]:
+    """Converts an object's entries (except skip_keys) and returns the whole object's JSON text, or None."""
+    return _convert_container(obj, skip_keys)
+
+
+def _convert_container(root: Any, skip_keys: set[str] | None) -> Tuple[Any, Optional[str]]:
+    """
+    Converts the entries of a decoded JSON list or dict, returning them with the container's JSON text.
+
+    Nested containers are walked with an explicit stack rather than recursion,
+    so deeply nested input cannot exhaust the Python call stack. Keys in
+    skip_keys (top level only) appear in the text but not in the result.
+    """
+    # State of the container being filled; parents wait on the stack. parts
+    # collects the entries' JSON text and becomes None once any is unencodable.
+    stack: List[Tuple[Any, ...]] = []
+    entries, converted, is_dict = _open_container(root)
+    source, parts, key_in_parent, skip = root, [], None, skip_keys
+    key: Any = None
+    while True:
+        for entry in entries:
+            if is_dict:
+                key, child = entry
+            else:
+                child = entry
+            if isinstance(child, (list, dict)):
+                # Finish the child first; this container resumes from its iterator afterwards
+                stack.append((source, entries, converted, parts, is_dict, key_in_parent, skip))
+                entries, converted, is_dict = _open_container(child)
+                source, parts, key_in_parent, skip = child, [], key, None
+                break
+            value, text = _convert_scalar(child)
+            parts = _add_entry(converted, parts, is_dict, key, value, text, skip)
+        else:
+            if parts is None:
+                text = None
+            else:
+                text = "{" + ", ".join(parts) + "}" if is_dict else "[" + ", ".join(parts) + "]"
+            if not stack:
+                return converted, text
+            value = _composite_value(source, converted, text)
+            key = key_in_parent
+            source, entries, converted, parts, is_dict, key_in_parent, skip = stack.pop()
+            parts = _add_entry(converted, parts, is_dict, key, value, text, skip)
+
+
+def _add_entry(
+    converted: Any, parts: Optional[List[str]], is_dict: bool, key: Any, value: Value, text: Optional[str], skip_keys: set[str] | None
+) -> Optional[List[str]]:
+    """Stores a converted entry and records its JSON text; returns the parts list, or None once unencodable."""
+    if parts is not None:
+        if text is None or (is_dict and type(key) is not str):
+            parts = None
+        else:
+            parts.append(f"{encode_basestring_ascii(key)}: {text}" if is_dict else text)
+    if not is_dict:
+        converted.append(value)
+    elif not (skip_keys and key in skip_keys):
+        # Attribute names repeat across resources and files; share one str per name
+        converted[intern(key) if type(key) is str else key] = value
+    return parts
+
+
+def _open_container(container: Any) -> Tuple[Iterator[Any], Any, bool]:
+    """Returns an entry iterator, an empty output container and whether the container is a dict."""
+    if isinstance(container, dict):
+        return iter(container.items()), {}, True
+    return iter(container), [], False
+
+
+def _composite_value(source: Any, converted: Any, text: Optional[str]) -> Value:
+    """Wraps converted list/dict entries in an array/object Value."""
+    kind = "object" if isinstance(converted, dict) else "array"
+    return {"type": kind, "value": converted, "raw": text if text is not None else _stringify(source)}
+
+
+def _convert_scalar(input_val: Any) -> Tuple[Value, Optional[str]]:
+    """Converts a non-container JSON value, returning it with its JSON text (None if not plain JSON data)."""
+    # Singletons get their raw and JSON text as constants. The Value dict itself
+    # stays per-occurrence because callers may mutate parsed documents.
     if input_val is None:
-        return {"type": "literal", "value": None, "raw": "null"}
+        return {"type": "literal", "value": None, "raw": "null"}, "null"
+    if input_val is True:
+        return {"type": "literal", "value": True, "raw": "True"}, "true"
+    if input_val is False:
+        return {"type": "literal", "value": False, "raw": "False"}, "false"
     if isinstance(input_val, str):
+        text = encode_basestring_ascii(input_val)
         if _looks_like_expression(input_val):
-            return classify_value(input_val)
-        return {"type": "literal", "value": input_val, "raw": input_val}
+            return classify_value_cached(input_val), text
+        return {"type": "literal", "value": input_val, "raw": input_val}, text
     if isinstance(input_val, (int, float, bool)):
-        return {"type": "literal", "value": input_val, "raw": str(input_val)}
-    if isinstance(input_val, list):
-        return {"type": "array", "value": [_convert_json_value(item) for item in input_val], "raw": _stringify(input_val)}
-    if isinstance(input_val, dict):
-        return {"type": "object", "value": {key: _convert_json_value(val) for key, val in input_val.items()}, "raw": _stringify(input_val)}
-    return {"type": "literal", "value": str(input_val), "raw": str(input_val)}
+        return {"type": "literal", "value": input_val, "raw": str(input_val)}, _scalar_json_text(input_val)
+    return {"type": "literal", "value": str(input_val), "raw": str(input_val)}, None
+
+
+def _scalar_json_text(value: Any) -> str:
+    """Encodes an int/float/bool exactly as json.dumps does."""
+    if value is True:
+        return "true"
+    if value is False:
+        return "false"
+    if isinstance(value, int):
+        return int.__repr__(value)
+    if value != value:
+        return "NaN"
+    if value == INFINITY:
+        return "Infinity"
+    if value == -INFINITY:
+        return "-Infinity"
+    return float.__repr__(value)
 
 
 def _looks_like_expression(value: str) -> bool:
-    return "${" in value or re.match(r"^[\w.]+\(", value) or re.match(r"^[\w.]+$", value)
+    if "${" in value:
+        return True
+    # Strings starting with whitespace or punctuation (e.g. absolute paths) cannot
+    # match; anything else, descriptions and ARNs included, takes the check below
+    first = value[:1]
+    if not (first.isalnum() or first == "_" or first == "."):
+        return False
+    # Equivalent to matching r"[\w.]+\(" or r"[\w.]+$" (\w is isalnum() or "_"), decided
+    # with C-level string methods: the text before the first "(" (or the whole
+    # string, minus a trailing newline) must consist solely of word characters and dots
+    paren = value.find("(")
+    if paren != -1:
+        head = value[:paren]
+    else:
+        head = value[:-1] if value.endswith("\n") else value
+    if not head:
+        return False
+    rest = head.replace(".", "").replace("_", "")
+    return not rest or rest.isalnum()
 
 
 def _stringify(value: Any) -> str:
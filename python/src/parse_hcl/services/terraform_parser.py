@@ -6,7 +6,9 @@ Parses .tf and .tf.json files into structured TerraformDocument objects.
 
 from __future__ import annotations
 
-from typing import List
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Any, Callable, Deque, Dict, Iterator, List, Optional, Tuple
 
 from ..parsers.generic_parser import (
     DataParser,
@@ -19,12 +21,18 @@ from ..parsers.generic_parser import (
 from ..parsers.locals_parser import LocalsParser
 from ..parsers.output_parser import OutputParser
 from ..parsers.variable_parser import VariableParser
-from ..types import DirectoryParseResult, FileParseResult, TerraformDocument, create_empty_document
+from ..types import DOCUMENT_BUCKETS, DirectoryParseResult, FileParseResult, HclBlock, TerraformDocument, create_empty_document
 from ..utils.common.fs import is_directory, list_terraform_files, path_exists, read_text_file
 from ..utils.common.logger import info
 from ..utils.lexer.block_scanner import BlockScanner
 from .terraform_json_parser import TerraformJsonParser
 
+PARALLEL_MIN_FILES = 8
+"""Minimum number of files before parse_directory fans out to worker processes."""
+
+READ_AHEAD_FILES = 4
+"""Number of files serial parse_directory reads ahead on background threads."""
+
 
 class TerraformParser:
     """
@@ -61,6 +69,24 @@ class TerraformParser:
         self.generic_block_parser = GenericBlockParser()
         self.json_parser = TerraformJsonParser()
 
+        # Block kind -> (parse function, document bucket, whether it returns a list of items)
+        generic = self.generic_block_parser.parse
+        self._block_handlers: Dict[str, Tuple[Callable[[HclBlock], Any], str, bool]] = {
+            "variable": (self.variable_parser.parse, "variable", False),
+            "output": (self.output_parser.parse, "output", False),
+            "locals": (self.locals_parser.parse, "locals", True),
+            "module": (self.module_parser.parse, "module", False),
+            "provider": (self.provider_parser.parse, "provider", False),
+            "resource": (self.resource_parser.parse, "resource", False),
+            "data": (self.data_parser.parse, "data", False),
+            "terraform": (self.terraform_settings_parser.parse, "terraform", False),
+            "moved": (generic, "moved", False),
+            "import": (generic, "import", False),
+            "check": (generic, "check", False),
+            "terraform_data": (generic, "terraform_data", False),
+            "unknown": (generic, "unknown", False),
+        }
+
     def parse_file(self, file_path: str) -> TerraformDocument:
         """
         Parses a single Terraform configuration file.
@@ -87,43 +113,50 @@ class TerraformParser:
             info(f"Parsing Terraform JSON file: {file_path}")
             return self.json_parser.parse_file(file_path)
 
+        return self.parse_content(read_text_file(file_path), file_path)
+
+    def parse_content(self, content: str, file_path: str) -> TerraformDocument:
+        """
+        Parses the already-read text of an HCL (.tf) configuration file.
+
+        Args:
+            content: The file contents.
+            file_path: Path recorded as the source of each parsed block.
+
+        Returns:
+            A TerraformDocument containing all parsed blocks.
+
+        Raises:
+            ParseError: If the content contains invalid HCL syntax.
+
+        Example:
+            >>> parser = TerraformParser()
+            >>> doc = parser.parse_content('variable "region" {}', 'inline.tf')
+            >>> print(doc['variable'][0]['name'])
+            region
+        """
         info(f"Parsing Terraform file: {file_path}")
-        content = read_text_file(file_path)
         blocks = self.scanner.scan(content, file_path)
         document = create_empty_document()
 
+        handlers = self._block_handlers
+        fallback = handlers["unknown"]
         for block in blocks:
-            kind = block["kind"]
-            if kind == "variable":
-                document["variable"].append(self.variable_parser.parse(block))
-            elif kind == "output":
-                document["output"].append(self.output_parser.parse(block))
-            elif kind == "locals":
-                document["locals"].extend(self.locals_parser.parse(block))
-            elif kind == "module":
-                document["module"].append(self.module_parser.parse(block))
-            elif kind == "provider":
-                document["provider"].append(self.provider_parser.parse(block))
-            elif kind == "resource":
-                document["resource"].append(self.resource_parser.parse(block))
-            elif kind == "data":
-                document["data"].append(self.data_parser.parse(block))
-            elif kind == "terraform":
-                document["terraform"].append(self.terraform_settings_parser.parse(block))
-            elif kind == "moved":
-                document["moved"].append(self.generic_block_parser.parse(block))
-            elif kind == "import":
-                document["import"].append(self.generic_block_parser.parse(block))
-            elif kind == "check":
-                document["check"].append(self.generic_block_parser.parse(block))
-            elif kind == "terraform_data":
-                document["terraform_data"].append(self.generic_block_parser.parse(block))
+            parse, bucket, returns_many = handlers.get(block["kind"], fallback)
+            if returns_many:
+                document[bucket].extend(parse(block))
             else:
-                document["unknown"].append(self.generic_block_parser.parse(block))
+                document[bucket].append(parse(block))
 
         return document
 
-    def parse_directory(self, dir_path: str, aggregate: bool = True, include_per_file: bool = True) -> DirectoryParseResult:
+    def parse_directory(
+        self,
+        dir_path: str,
+        aggregate: bool = True,
+        include_per_file: bool = True,
+        jobs: Optional[int] = None,
+    ) -> DirectoryParseResult:
         """
         Parses all Terraform configuration files in a directory.
 
@@ -134,6 +167,13 @@ class TerraformParser:
             dir_path: Path to the directory to parse.
             aggregate: Whether to combine all files into a single document (default: True).
             include_per_file: Whether to include per-file results (default: True).
+            jobs: Number of worker processes used to parse files in parallel.
+                  Files are parsed serially when None/1 (default) or when the
+                  directory holds fewer than PARALLEL_MIN_FILES files. Workers
+                  use a plain TerraformParser, so subclass overrides of
+                  parse_file only apply to serial parsing. Serial parsing
+                  reads upcoming files on background threads unless
+                  parse_file is overridden.
 
         Returns:
             A DirectoryParseResult containing:
@@ -155,7 +195,20 @@ class TerraformParser:
             raise ValueError(f"Invalid directory path: {dir_path}")
 
         files = list_terraform_files(dir_path)
-        parsed_files: List[FileParseResult] = [{"path": file_path, "document": self.parse_file(file_path)} for file_path in files]
+        if jobs and jobs > 1 and len(files) >= PARALLEL_MIN_FILES:
+            # Files are independent until combine(), so parse them in worker processes
+            workers = min(jobs, len(files))
+            with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker) as executor:
+                documents = list(executor.map(_parse_file_in_worker, files, chunksize=max(1, len(files) // (workers * 4))))
+        elif len(files) > 1 and type(self).parse_file is TerraformParser.parse_file:
+            # Read upcoming files on threads while this one parses; JSON files are read by their parser
+            documents = [
+                self.parse_content(content, file_path) if content is not None else self.parse_file(file_path)
+                for file_path, content in _read_ahead(files)
+            ]
+        else:
+            documents = [self.parse_file(file_path) for file_path in files]
+        parsed_files: List[FileParseResult] = [{"path": file_path, "document": document} for file_path, document in zip(files, documents)]
 
         combined = self.combine([item["document"] for item in parsed_files]) if aggregate else None
         result: DirectoryParseResult = {"files": parsed_files if include_per_file else []}
@@ -181,19 +234,51 @@ class TerraformParser:
             >>> doc2 = parser.parse_file('variables.tf')
             >>> combined = parser.combine([doc1, doc2])
         """
-        combined = create_empty_document()
-        for doc in documents:
-            combined["terraform"].extend(doc.get("terraform", []))
-            combined["provider"].extend(doc.get("provider", []))
-            combined["variable"].extend(doc.get("variable", []))
-            combined["output"].extend(doc.get("output", []))
-            combined["module"].extend(doc.get("module", []))
-            combined["resource"].extend(doc.get("resource", []))
-            combined["data"].extend(doc.get("data", []))
-            combined["locals"].extend(doc.get("locals", []))
-            combined["moved"].extend(doc.get("moved", []))
-            combined["import"].extend(doc.get("import", []))
-            combined["check"].extend(doc.get("check", []))
-            combined["terraform_data"].extend(doc.get("terraform_data", []))
-            combined["unknown"].extend(doc.get("unknown", []))
-        return combined
+        # Each bucket walks the documents again, so a one-shot iterable must be materialized
+        documents = list(documents)
+        combined: Dict[str, List[Any]] = {}
+        # Fill one bucket at a time through a bound extend; missing buckets
+        # default to an empty tuple, which needs no allocation
+        for bucket in DOCUMENT_BUCKETS:
+            merged: List[Any] = []
+            extend = merged.extend
+            for doc in documents:
+                extend(doc.get(bucket, ()))
+            combined[bucket] = merged
+        return combined  # type: ignore[return-value]
+
+
+def _read_ahead(files: List[str]) -> Iterator[Tuple[str, Optional[str]]]:
+    """
+    Yields each path with its contents, reading the next files on threads meanwhile.
+
+    At most READ_AHEAD_FILES reads are in flight. .tf.json paths yield None
+    content and are left to the JSON parser. Read errors surface when the
+    failing file's turn comes, as with sequential reads.
+    """
+    with ThreadPoolExecutor(max_workers=READ_AHEAD_FILES) as executor:
+        pending: Deque[Tuple[str, Optional[Future[str]]]] = deque()
+        for file_path in files:
+            pending.append((file_path, None if file_path.endswith(".tf.json") else executor.submit(read_text_file, file_path)))
+            if len(pending) > READ_AHEAD_FILES:
+                ready_path, future = pending.popleft()
+                yield ready_path, future.result() if future is not None else None
+        while pending:
+            ready_path, future = pending.popleft()
+            yield ready_path, future.result() if future is not None else None
+
+
+_worker_parser: Optional[TerraformParser] = None
+
+
+def _init_worker() -> None:
+    """Builds the per-process parser once when a worker process starts."""
+    global _worker_parser
+    _worker_parser = TerraformParser()
+
+
+def _parse_file_in_worker(file_path: str) -> TerraformDocument:
+    """Parses one file inside a worker process, reusing the per-process parser."""
+    if _worker_parser is None:
+        _init_worker()
+    return _worker_parser.parse_file(file_path)  # type: ignore[union-attr]
@@ -454,10 +454,31 @@ class TerraformDocument(TypedDict):
     unknown: List[GenericBlock]
 
 
+DOCUMENT_BUCKETS = (
+    "terraform",
+    "provider",
+    "variable",
+    "output",
+    "module",
+    "resource",
+    "data",
+    "locals",
+    "moved",
+    "import",
+    "check",
+    "terraform_data",
+    "unknown",
+)
+"""TerraformDocument keys, in document order."""
+
+
 def create_empty_document() -> Dict[str, List[Any]]:
     """
     Creates an empty TerraformDocument with all arrays initialized.
 
+    The keys match DOCUMENT_BUCKETS; a dict display is kept because it is
+    cheaper than building the dict from the tuple.
+
     Returns:
         A new empty TerraformDocument dictionary.
     """
@@ -779,6 +800,7 @@ __all__ = [
     "PlanModule",
     "PlannedValues",
     "TerraformPlanDocument",
-    # Functions
+    # Constants and functions
+    "DOCUMENT_BUCKETS",
     "create_empty_document",
 ]
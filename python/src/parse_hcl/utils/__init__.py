@@ -40,8 +40,16 @@ from .lexer import (
     split_array_elements,
     split_object_entries,
 )
-from .parser import classify_value, parse_block_body
-from .serialization import to_export, to_json, to_json_export, to_yaml, to_yaml_document
+from .parser import classify_value, classify_value_cached, parse_block_body, parse_block_body_cached
+from .serialization import (
+    to_export,
+    to_json,
+    to_json_export,
+    to_json_export_stream,
+    to_json_stream,
+    to_yaml,
+    to_yaml_document,
+)
 
 __all__ = [
     # common
@@ -84,11 +92,15 @@ __all__ = [
     "split_object_entries",
     # parser
     "classify_value",
+    "classify_value_cached",
     "parse_block_body",
+    "parse_block_body_cached",
     # serialization
     "to_export",
     "to_json",
     "to_json_export",
+    "to_json_export_stream",
+    "to_json_stream",
     "to_yaml",
     "to_yaml_document",
 ]
@@ -6,8 +6,12 @@ Provides error types with source location information for debugging.
 
 from __future__ import annotations
 
+from bisect import bisect_right
 from dataclasses import dataclass
-from typing import Optional
+from functools import lru_cache
+from itertools import accumulate, repeat
+from operator import add
+from typing import List, Optional
 
 
 @dataclass
@@ -21,6 +25,9 @@ class SourceLocation:
         offset: 0-based character offset from start of content.
     """
 
+    # Declared by hand (dataclass(slots=True) needs Python 3.10) to drop the per-instance __dict__
+    __slots__ = ("line", "column", "offset")
+
     line: int
     column: int
     offset: int
@@ -36,6 +43,8 @@ class SourceRange:
         end: The ending SourceLocation.
     """
 
+    __slots__ = ("start", "end")
+
     start: SourceLocation
     end: SourceLocation
 
@@ -97,17 +106,33 @@ def offset_to_location(content: str, offset: int) -> SourceLocation:
         SourceLocation(line=2, column=2, offset=7)
     """
     safe_offset = min(offset, len(content))
-    line = 1
-    column = 1
+    line_starts = _line_starts(content)
+    # Line n starts at line_starts[n - 1]; negative offsets stay on line 1, column 1
+    position = max(safe_offset, 0)
+    line = bisect_right(line_starts, position)
+
+    return SourceLocation(line=line, column=position - line_starts[line - 1] + 1, offset=safe_offset)
+
+
+@lru_cache(maxsize=8)
+def _line_starts(content: str) -> List[int]:
+    """
+    Lists the offset at which each line of content starts, memoized per content.
 
-    for i in range(safe_offset):
-        if content[i] == "\n":
-            line += 1
-            column = 1
-        else:
-            column += 1
+    The index is built entirely in C (split on newlines, then a running sum of
+    line lengths plus one); later lookups in the same content are a binary
+    search. The returned list is shared and must not be mutated.
 
-    return SourceLocation(line=line, column=column, offset=safe_offset)
+    Args:
+        content: The full source content.
+
+    Returns:
+        Sorted line start offsets, beginning with 0.
+    """
+    starts = list(accumulate(map(add, map(len, content.split("\n")), repeat(1)), initial=0))
+    # The final sum is one past the end of content, not the start of a line
+    starts.pop()
+    return starts
 
 
 def offsets_to_range(content: str, start_offset: int, end_offset: int) -> SourceRange:
@@ -0,0 +1,268 @@
+"""
+JSON helpers with an optional orjson fast path.
+
+When the optional ``orjson`` package is installed it is used for decoding and
+for indented encoding; otherwise the standard library ``json`` module is used.
+Output is identical either way: values orjson would encode differently from
+``json.dumps`` are encoded by ``json``.
+
+When the optional ``ijson`` package is installed, :func:`load_streaming`
+decodes large files incrementally; otherwise it falls back to ``json``.
+"""
+
+from __future__ import annotations
+
+import json
+import re
+from pathlib import Path
+from typing import Any, Callable, List, Optional, TextIO, Union
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - depends on the environment
+    orjson = None  # type: ignore[assignment]
+
+try:
+    import ijson
+except ImportError:  # pragma: no cover - depends on the environment
+    ijson = None  # type: ignore[assignment]
+
+HAS_ORJSON = orjson is not None
+"""Whether the orjson backend is available."""
+
+HAS_IJSON = ijson is not None
+"""Whether the ijson incremental decoder is available."""
+
+LONG_DIGIT_RUN_PATTERN = re.compile(r"\d{19}")
+"""Digit runs long enough to hold an integer outside orjson's 64-bit range."""
+
+LONG_DIGIT_RUN_BYTES_PATTERN = re.compile(rb"\d{19}")
+"""LONG_DIGIT_RUN_PATTERN for UTF-8 encoded input."""
+
+ORJSON_OPTIONS = orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS if orjson is not None else 0
+"""orjson options matching json.dumps(indent=2), including its coercion of non-string keys."""
+
+
+def loads(text: Union[str, bytes]) -> Any:
+    """
+    Decodes JSON text.
+
+    Uses orjson when available. Input orjson rejects or decodes differently
+    (NaN/Infinity, integers beyond 64 bits) is decoded by json, so results and
+    errors are the same as ``json.loads``. Bytes are decoded as UTF-8 (with
+    no BOM), which orjson does without building an intermediate string.
+
+    Args:
+        text: The JSON text, or its UTF-8 encoding.
+
+    Returns:
+        The decoded value.
+
+    Raises:
+        json.JSONDecodeError: If the text is not valid JSON.
+
+    Example:
+        >>> loads('{"a": [1, 2]}')
+        {'a': [1, 2]}
+    """
+    # orjson turns integers outside the 64-bit range into floats, so any run of
+    # 19+ digits (possibly inside a string; harmless) sends the text to json
+    is_bytes = isinstance(text, bytes)
+    pattern = LONG_DIGIT_RUN_BYTES_PATTERN if is_bytes else LONG_DIGIT_RUN_PATTERN
+    if orjson is not None and not pattern.search(text):  # type: ignore[arg-type]
+        try:
+            return orjson.loads(text)
+        except orjson.JSONDecodeError:
+            pass
+    # json.loads would sniff the encoding of bytes and accept a BOM; decode strictly instead
+    return json.loads(text.decode("utf-8") if is_bytes else text)  # type: ignore[union-attr]
+
+
+def dumps(value: Any, indent: bool = False) -> str:
+    """
+    Encodes a value as a JSON string.
+
+    Args:
+        value: The value to encode.
+        indent: If True, pretty-prints with 2-space indentation.
+
+    Returns:
+        The JSON text.
+
+    Example:
+        >>> dumps({"a": [1, 2]})
+        '{"a": [1, 2]}'
+    """
+    # orjson's compact form drops the spaces json puts after ',' and ':',
+    # so only indented output (where both agree) goes through it
+    if indent:
+        text = _orjson_dumps_indented(value)
+        if text is not None:
+            return text
+    return json.dumps(value, indent=2 if indent else None)
+
+
+def dump(value: Any, fp: TextIO, indent: bool = False) -> None:
+    """
+    Encodes a value as JSON into a text stream.
+
+    When orjson can encode the value it is encoded in one native call and
+    written once; otherwise the json module streams it chunk by chunk.
+
+    Args:
+        value: The value to encode.
+        fp: A writable text stream.
+        indent: If True, pretty-prints with 2-space indentation.
+    """
+    if indent:
+        text = _orjson_dumps_indented(value)
+        if text is not None:
+            fp.write(text)
+            return
+    json.dump(value, fp, indent=2 if indent else None)
+
+
+def _orjson_dumps_indented(value: Any) -> Optional[str]:
+    """
+    Encodes a value as indented JSON with orjson when its output matches json's.
+
+    Args:
+        value: The value to encode.
+
+    Returns:
+        The JSON text, or None when orjson is unavailable or would encode the
+        value differently (callers then use json).
+    """
+    if orjson is None or not _orjson_compatible(value):
+        return None
+    try:
+        return orjson.dumps(value, option=ORJSON_OPTIONS).decode("utf-8")
+    except TypeError:
+        # Values orjson rejects (e.g. integers beyond 64 bits) fall back to json
+        return None
+
+
+def _orjson_compatible(value: Any) -> bool:
+    """
+    Checks whether orjson encodes a value exactly as ``json.dumps`` does.
+
+    orjson writes non-ASCII text and DEL unescaped, formats small exponents as
+    ``1e-7`` rather than ``1e-07`` and writes NaN/Infinity as null. Values
+    containing any of those, or anything other than plain JSON data, are
+    reported as incompatible.
+
+    Args:
+        value: The value to check.
+
+    Returns:
+        True if both encoders produce the same text.
+    """
+    stack = [value]
+    pop = stack.pop
+    extend = stack.extend
+    while stack:
+        item = pop()
+        kind = type(item)
+        if kind is str:
+            if not item.isascii() or "\x7f" in item:
+                return False
+        elif kind is dict:
+            for key in item:
+                if type(key) is str:
+                    if not key.isascii() or "\x7f" in key:
+                        return False
+                elif not (key is None or type(key) is int or type(key) is bool or (type(key) is float and _float_compatible(key))):
+                    return False
+            extend(item.values())
+        elif kind is list or kind is tuple:
+            extend(item)
+        elif kind is float:
+            if not _float_compatible(item):
+                return False
+        elif not (item is None or kind is int or kind is bool):
+            return False
+    return True
+
+
+def _float_compatible(value: float) -> bool:
+    """Checks whether orjson formats a float like float.__repr__ (as json does)."""
+    text = float.__repr__(value)
+    if "e" not in text:
+        return "n" not in text  # nan and inf
+    return orjson.dumps(value) == text.encode("ascii")
+
+
+def load_streaming(file_path: str, key: str, transform: Callable[[Any], Any]) -> Any:
+    """
+    Decodes a JSON file, transforming the items of one top-level array as they are read.
+
+    With ijson each item of ``document[key]`` is handed to ``transform`` as
+    soon as it is complete and then released, so peak memory holds one raw
+    item rather than the whole array. Without ijson (or for input only the
+    json module accepts, such as NaN) the file is decoded in one go and the
+    items are transformed afterwards. Either way the result is the decoded
+    document with ``document[key]`` replaced by the transformed items when it
+    is a list.
+
+    Args:
+        file_path: Path to the JSON file.
+        key: Top-level key holding the array to stream.
+        transform: Called with each decoded array item.
+
+    Returns:
+        The decoded document.
+
+    Raises:
+        FileNotFoundError: If the file does not exist.
+        json.JSONDecodeError: If the file is not valid JSON.
+
+    Example:
+        >>> state = load_streaming("terraform.tfstate", "resources", normalize)
+    """
+    if ijson is not None:
+        try:
+            return _load_streaming_ijson(file_path, key, transform)
+        except ijson.JSONError:
+            pass
+
+    data = loads(Path(file_path).read_text(encoding="utf-8"))
+    items = data.get(key) if isinstance(data, dict) else None
+    if isinstance(items, list):
+        data[key] = [transform(item) for item in items]
+    return data
+
+
+def _load_streaming_ijson(file_path: str, key: str, transform: Callable[[Any], Any]) -> Any:
+    """Single-pass ijson implementation of :func:`load_streaming`."""
+    item_prefix = f"{key}.item"
+    document = ijson.ObjectBuilder()
+    item = None
+    in_array = False
+    transformed: List[Any] = []
+
+    with open(file_path, "rb") as fp:
+        for prefix, event, value in ijson.parse(fp, use_float=True):
+            if item is not None:
+                item.event(event, value)
+                if prefix == item_prefix and (event == "end_map" or event == "end_array"):
+                    transformed.append(transform(item.value))
+                    item = None
+                continue
+            if in_array and prefix == item_prefix:
+                if event == "start_map" or event == "start_array":
+                    item = ijson.ObjectBuilder()
+                    item.event(event, value)
+                else:
+                    transformed.append(transform(value))
+                continue
+            if prefix == key and event == "start_array":
+                in_array = True
+                transformed = []
+            elif prefix == key and event == "end_array":
+                in_array = False
+            document.event(event, value)
+
+    data = document.value
+    if isinstance(data, dict) and isinstance(data.get(key), list):
+        data[key] = transformed
+    return data
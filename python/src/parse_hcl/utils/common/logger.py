@@ -10,29 +10,16 @@ from __future__ import annotations
 import os
 import sys
 
-
-def _enabled(level: str) -> bool:
-    """
-    Checks if a given log level is enabled.
-
-    Args:
-        level: The log level to check ('debug', 'info', 'warn').
-
-    Returns:
-        True if the level is enabled. Debug is disabled by default
-        unless TF_PARSER_DEBUG environment variable is set.
-    """
-    env = os.environ.get("TF_PARSER_DEBUG")
-    if not env:
-        return level != "debug"
-    return True
+DEBUG_ENABLED = bool(os.environ.get("TF_PARSER_DEBUG"))
+"""Whether debug logging is on. Read once at import from TF_PARSER_DEBUG."""
 
 
 def debug(*args: object) -> None:
     """
     Logs a debug message to stderr.
 
-    Debug messages are only shown when TF_PARSER_DEBUG is set.
+    Debug messages are only shown when TF_PARSER_DEBUG is set at import time;
+    otherwise this function is replaced by a no-op.
 
     Args:
         *args: Values to print, space-separated.
@@ -41,8 +28,7 @@ def debug(*args: object) -> None:
         >>> debug("Parsing block", block_name)
         [parser:debug] Parsing block my_resource
     """
-    if _enabled("debug"):
-        print("[parser:debug]", *args, file=sys.stderr)
+    print("[parser:debug]", *args, file=sys.stderr)
 
 
 def info(*args: object) -> None:
@@ -56,8 +42,7 @@ def info(*args: object) -> None:
         >>> info("Processed", count, "files")
         [parser:info] Processed 5 files
     """
-    if _enabled("info"):
-        print("[parser:info]", *args)
+    print("[parser:info]", *args)
 
 
 def warn(*args: object) -> None:
@@ -71,5 +56,12 @@ def warn(*args: object) -> None:
         >>> warn("Unclosed block at line", line_num)
         [parser:warn] Unclosed block at line 42
     """
-    if _enabled("warn"):
-        print("[parser:warn]", *args, file=sys.stderr)
+    print("[parser:warn]", *args, file=sys.stderr)
+
+
+def _disabled(*args: object) -> None:
+    """Discards a log message for a disabled level."""
+
+
+if not DEBUG_ENABLED:
+    debug = _disabled  # noqa: F811
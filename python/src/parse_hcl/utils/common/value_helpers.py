@@ -30,8 +30,10 @@ def literal_string(value: Optional[Value]) -> Optional[str]:
         >>> literal_string(val)
         None
     """
-    if value and value.get("type") == "literal" and isinstance(value.get("value"), str):
-        return value["value"]  # type: ignore[return-value]
+    if value and value.get("type") == "literal":
+        v = value.get("value")
+        if type(v) is str:
+            return v
     return None
 
 
@@ -54,8 +56,10 @@ def literal_boolean(value: Optional[Value]) -> Optional[bool]:
         >>> literal_boolean(val)
         None
     """
-    if value and value.get("type") == "literal" and isinstance(value.get("value"), bool):
-        return value["value"]  # type: ignore[return-value]
+    if value and value.get("type") == "literal":
+        v = value.get("value")
+        if type(v) is bool:
+            return v
     return None
 
 
@@ -87,10 +91,9 @@ def literal_number(value: Optional[Value]) -> Optional[Union[int, float]]:
     """
     if value and value.get("type") == "literal":
         v = value.get("value")
-        # Check for bool first since bool is a subclass of int in Python
-        if isinstance(v, bool):
-            return None
-        if isinstance(v, (int, float)):
+        # Exact type checks also reject bool, which is a subclass of int
+        t = type(v)
+        if t is int or t is float:
             return v
     return None
 
@@ -116,10 +119,8 @@ def literal_int(value: Optional[Value]) -> Optional[int]:
     """
     if value and value.get("type") == "literal":
         v = value.get("value")
-        # Check for bool first since bool is a subclass of int in Python
-        if isinstance(v, bool):
-            return None
-        if isinstance(v, int):
+        # An exact type check also rejects bool, which is a subclass of int
+        if type(v) is int:
             return v
     return None
 
@@ -148,6 +149,6 @@ def literal_float(value: Optional[Value]) -> Optional[float]:
     """
     if value and value.get("type") == "literal":
         v = value.get("value")
-        if isinstance(v, float) and not isinstance(v, bool):
+        if type(v) is float:
             return v
     return None
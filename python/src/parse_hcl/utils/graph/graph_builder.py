@@ -8,7 +8,8 @@ by analyzing references in values and attributes.
 from __future__ import annotations
 
 import json
-from typing import Any, Dict, List, Optional, Set
+from itertools import chain
+from typing import Any, Dict, FrozenSet, Iterable, List, Optional, Set, Tuple, Union
 
 from ...types import (
     DependencyGraph,
@@ -23,6 +24,19 @@ from ...types import (
 GRAPH_VERSION = "1.0.0"
 """Current version of the graph export format."""
 
+REFERENCE_NODE_FIELDS: Dict[str, Tuple[str, Optional[str], str]] = {
+    "variable": ("variable", None, "name"),
+    "local": ("locals", None, "name"),
+    "module_output": ("module_output", "module", "name"),
+    "data": ("data", "data_type", "name"),
+    "resource": ("resource", "resource_type", "name"),
+    "path": ("path", None, "name"),
+    "each": ("each", None, "property"),
+    "count": ("count", None, "property"),
+    "self": ("self", None, "attribute"),
+}
+"""Per reference kind: the target node kind, the reference field holding its type (if any) and the one holding its name."""
+
 
 def build_dependency_graph(document: TerraformDocument) -> DependencyGraph:
     """
@@ -49,9 +63,12 @@ def build_dependency_graph(document: TerraformDocument) -> DependencyGraph:
     nodes: Dict[str, GraphNode] = {}
     edges: List[Dict[str, Any]] = []
     orphan_references: List[ReferenceDict] = []
-    edge_keys: Set[str] = set()
+    edge_keys: Set[Tuple[str, str, Union[FrozenSet[Any], str]]] = set()
+    # Resolved target node per distinct reference; repeated references skip resolution
+    targets: Dict[Union[FrozenSet[Any], str], Optional[GraphNode]] = {}
 
-    _populate_nodes(document, nodes)
+    # Node ids per bucket, in document order, so each block's id is built only once
+    node_ids = _populate_nodes(document, nodes)
 
     def add_edges(
         from_node: Optional[GraphNode],
@@ -62,11 +79,14 @@ def build_dependency_graph(document: TerraformDocument) -> DependencyGraph:
         if not from_node or not refs:
             return
         for ref in refs:
-            target = _ensure_target_node(ref, nodes)
+            identity = _ref_identity(ref)
+            target = targets.get(identity)
+            if target is None:
+                target = targets[identity] = _ensure_target_node(ref, nodes)
             if not target:
                 orphan_references.append(ref)
                 continue
-            key = f"{from_node['id']}->{target['id']}:{_ref_key(ref)}"
+            key = (from_node["id"], target["id"], identity)
             if key in edge_keys:
                 continue
             edge_keys.add(key)
@@ -78,33 +98,33 @@ def build_dependency_graph(document: TerraformDocument) -> DependencyGraph:
             })
 
     # Process terraform settings blocks
+    settings_node = nodes.get(node_ids["terraform"][0])
     for block in document.get("terraform", []):
-        node = nodes.get(_node_id("terraform", "settings"))
-        add_edges(node, _references_from_attributes(block.get("properties")), block.get("source"))
+        add_edges(settings_node, _references_from_attributes(block.get("properties")), block.get("source"))
 
     # Process provider blocks
-    for provider in document.get("provider", []):
-        node = nodes.get(_node_id("provider", provider.get("name"), provider.get("alias")))
+    for provider, node_id in zip(document.get("provider", []), node_ids["provider"]):
+        node = nodes.get(node_id)
         add_edges(node, _references_from_attributes(provider.get("properties")), provider.get("source"))
 
     # Process variable blocks
-    for variable in document.get("variable", []):
-        node = nodes.get(_node_id("variable", variable.get("name")))
+    for variable, node_id in zip(document.get("variable", []), node_ids["variable"]):
+        node = nodes.get(node_id)
         add_edges(node, _references_from_value(variable.get("default")), variable.get("source"))
 
     # Process output blocks
-    for output in document.get("output", []):
-        node = nodes.get(_node_id("output", output.get("name")))
+    for output, node_id in zip(document.get("output", []), node_ids["output"]):
+        node = nodes.get(node_id)
         add_edges(node, _references_from_value(output.get("value")), output.get("source"))
 
     # Process module blocks
-    for module in document.get("module", []):
-        node = nodes.get(_node_id("module", module.get("name")))
+    for module, node_id in zip(document.get("module", []), node_ids["module"]):
+        node = nodes.get(node_id)
         add_edges(node, _references_from_attributes(module.get("properties")), module.get("source"))
 
     # Process resource blocks
-    for resource in document.get("resource", []):
-        node = nodes.get(_node_id("resource", resource.get("type"), resource.get("name")))
+    for resource, node_id in zip(document.get("resource", []), node_ids["resource"]):
+        node = nodes.get(node_id)
         add_edges(node, _references_from_attributes(resource.get("properties")), resource.get("source"))
         add_edges(node, _references_from_attributes(resource.get("meta")), resource.get("source"))
 
@@ -117,23 +137,25 @@ def build_dependency_graph(document: TerraformDocument) -> DependencyGraph:
         add_edges(node, _references_from_nested_blocks(resource.get("blocks", [])), resource.get("source"))
 
     # Process data blocks
-    for data in document.get("data", []):
-        node = nodes.get(_node_id("data", data.get("dataType"), data.get("name")))
+    for data, node_id in zip(document.get("data", []), node_ids["data"]):
+        node = nodes.get(node_id)
         add_edges(node, _references_from_attributes(data.get("properties")), data.get("source"))
         add_edges(node, _references_from_nested_blocks(data.get("blocks", [])), data.get("source"))
 
     # Process locals blocks
-    for local in document.get("locals", []):
-        node = nodes.get(_node_id("locals", local.get("name")))
+    for local, node_id in zip(document.get("locals", []), node_ids["locals"]):
+        node = nodes.get(node_id)
         add_edges(node, _references_from_value(local.get("value")), local.get("source"))
 
-    # Process other block types (moved, import, check, terraform_data, unknown)
-    other_blocks: List[Dict[str, Any]] = []
-    other_blocks.extend(document.get("moved", []))
-    other_blocks.extend(document.get("import", []))
-    other_blocks.extend(document.get("check", []))
-    other_blocks.extend(document.get("terraform_data", []))
-    other_blocks.extend(document.get("unknown", []))
+    # Process other block types (moved, import, check, terraform_data, unknown),
+    # chaining the buckets rather than copying them into one list
+    other_blocks: Iterable[Dict[str, Any]] = chain(
+        document.get("moved", []),
+        document.get("import", []),
+        document.get("check", []),
+        document.get("terraform_data", []),
+        document.get("unknown", []),
+    )
 
     for block in other_blocks:
         all_refs = (
@@ -142,16 +164,21 @@ def build_dependency_graph(document: TerraformDocument) -> DependencyGraph:
         )
         labels = block.get("labels") or ["default"]
         block_type = block.get("type")
-        block_node = nodes.get(_node_id(block_type, labels[0]))
+        block_id = _node_id(block_type, labels[0])
+        block_node = nodes.get(block_id)
 
         if not block_node:
             new_node: GraphNode = {
-                "id": _node_id(block_type, labels[0]),
+                "id": block_id,
                 "kind": block_type,  # type: ignore[typeddict-item]
                 "name": labels[0],
                 "source": block.get("source"),
             }
             nodes[new_node["id"]] = new_node
+            if not block_id:
+                # References of unknown kind look up node "" before falling back to an
+                # external node, so their cached targets now resolve to this node instead
+                targets.clear()
             add_edges(new_node, all_refs, block.get("source"))
         else:
             add_edges(block_node, all_refs, block.get("source"))
@@ -187,28 +214,35 @@ def create_export(document: TerraformDocument) -> TerraformExport:
     }
 
 
-def _populate_nodes(document: TerraformDocument, nodes: Dict[str, GraphNode]) -> None:
+def _populate_nodes(document: TerraformDocument, nodes: Dict[str, GraphNode]) -> Dict[str, List[str]]:
     """
     Populates the nodes dictionary with all configuration elements.
 
     Args:
         document: The TerraformDocument to extract nodes from.
         nodes: Dictionary to populate with nodes (mutated in place).
+
+    Returns:
+        For each document bucket, the node id of every block in document
+        order (the terraform entry holds the single settings node id).
     """
-    def add_node(node: GraphNode) -> None:
+    def add_node(node: GraphNode) -> str:
         node_id = node.get("id", "")
         if node_id and node_id not in nodes:
             nodes[node_id] = node
+        return node_id
+
+    node_ids: Dict[str, List[str]] = {}
 
     # Always add terraform settings node
-    add_node({
+    node_ids["terraform"] = [add_node({
         "id": _node_id("terraform", "settings"),
         "kind": "terraform",
         "name": "settings",
-    })
+    })]
 
     # Add provider nodes
-    for provider in document.get("provider", []):
+    node_ids["provider"] = [
         add_node({
             "id": _node_id("provider", provider.get("name"), provider.get("alias")),
             "kind": "provider",
@@ -216,36 +250,44 @@ def _populate_nodes(document: TerraformDocument, nodes: Dict[str, GraphNode]) ->
             "type": provider.get("name"),
             "source": provider.get("source"),
         })
+        for provider in document.get("provider", [])
+    ]
 
     # Add variable nodes
-    for variable in document.get("variable", []):
+    node_ids["variable"] = [
         add_node({
             "id": _node_id("variable", variable.get("name")),
             "kind": "variable",
             "name": variable.get("name"),
             "source": variable.get("source"),
         })
+        for variable in document.get("variable", [])
+    ]
 
     # Add output nodes
-    for output in document.get("output", []):
+    node_ids["output"] = [
         add_node({
             "id": _node_id("output", output.get("name")),
             "kind": "output",
             "name": output.get("name"),
             "source": output.get("source"),
         })
+        for output in document.get("output", [])
+    ]
 
     # Add module nodes
-    for module in document.get("module", []):
+    node_ids["module"] = [
         add_node({
             "id": _node_id("module", module.get("name")),
             "kind": "module",
             "name": module.get("name"),
             "source": module.get("source"),
         })
+        for module in document.get("module", [])
+    ]
 
     # Add resource nodes
-    for resource in document.get("resource", []):
+    node_ids["resource"] = [
         add_node({
             "id": _node_id("resource", resource.get("type"), resource.get("name")),
             "kind": "resource",
@@ -253,9 +295,11 @@ def _populate_nodes(document: TerraformDocument, nodes: Dict[str, GraphNode]) ->
             "type": resource.get("type"),
             "source": resource.get("source"),
         })
+        for resource in document.get("resource", [])
+    ]
 
     # Add data nodes
-    for data in document.get("data", []):
+    node_ids["data"] = [
         add_node({
             "id": _node_id("data", data.get("dataType"), data.get("name")),
             "kind": "data",
@@ -263,15 +307,21 @@ def _populate_nodes(document: TerraformDocument, nodes: Dict[str, GraphNode]) ->
             "type": data.get("dataType"),
             "source": data.get("source"),
         })
+        for data in document.get("data", [])
+    ]
 
     # Add locals nodes
-    for local in document.get("locals", []):
+    node_ids["locals"] = [
         add_node({
             "id": _node_id("locals", local.get("name")),
             "kind": "locals",
             "name": local.get("name"),
             "source": local.get("source"),
         })
+        for local in document.get("locals", [])
+    ]
+
+    return node_ids
 
 
 def _references_from_attributes(attributes: Optional[Dict[str, Any]]) -> List[ReferenceDict]:
@@ -294,7 +344,10 @@ def _references_from_attributes(attributes: Optional[Dict[str, Any]]) -> List[Re
 
 def _references_from_nested_blocks(blocks: List[Dict[str, Any]]) -> List[ReferenceDict]:
     """
-    Recursively extracts references from nested blocks.
+    Extracts references from nested blocks and all blocks nested within them.
+
+    Blocks are visited depth-first in document order using an explicit stack,
+    so deep nesting needs no recursion.
 
     Args:
         blocks: List of nested block dictionaries.
@@ -303,9 +356,14 @@ def _references_from_nested_blocks(blocks: List[Dict[str, Any]]) -> List[Referen
         List of all references found in nested blocks.
     """
     refs: List[ReferenceDict] = []
-    for block in blocks or []:
+    # Children are pushed in reverse so they pop in document order
+    stack = list(reversed(blocks or []))
+    while stack:
+        block = stack.pop()
         refs.extend(_references_from_attributes(block.get("attributes")))
-        refs.extend(_references_from_nested_blocks(block.get("blocks", [])))
+        nested = block.get("blocks")
+        if nested:
+            stack.extend(reversed(nested))
     return refs
 
 
@@ -313,6 +371,9 @@ def _references_from_value(value: Any) -> List[ReferenceDict]:
     """
     Extracts references from a Value object, including nested values.
 
+    Nested object and array values are walked depth-first with an explicit
+    stack, collecting into a single list, so deep nesting needs no recursion.
+
     Args:
         value: A Value dictionary or any other value.
 
@@ -321,21 +382,31 @@ def _references_from_value(value: Any) -> List[ReferenceDict]:
     """
     if not isinstance(value, dict):
         return []
+    value_type = value.get("type")
+    if value_type != "object" and value_type != "array":
+        # Most values are leaves; they need no stack
+        return value.get("references") or []
 
-    direct: List[ReferenceDict] = value.get("references") or []
-
-    # Recursively extract from object values
-    if value.get("type") == "object" and isinstance(value.get("value"), dict):
-        return direct + _references_from_attributes(value.get("value"))
-
-    # Recursively extract from array values
-    if value.get("type") == "array" and isinstance(value.get("value"), list):
-        nested: List[ReferenceDict] = []
-        for item in value.get("value"):
-            nested.extend(_references_from_value(item))
-        return direct + nested
+    refs: List[ReferenceDict] = []
+    stack = [value]
+    while stack:
+        current = stack.pop()
+        if not isinstance(current, dict):
+            continue
+
+        direct = current.get("references")
+        if direct:
+            refs.extend(direct)
+
+        # Children are pushed in reverse so they pop in document order
+        value_type = current.get("type")
+        nested = current.get("value")
+        if value_type == "object" and isinstance(nested, dict):
+            stack.extend(reversed(nested.values()))
+        elif value_type == "array" and isinstance(nested, list):
+            stack.extend(reversed(nested))
 
-    return direct
+    return refs
 
 
 def _node_id(
@@ -354,6 +425,10 @@ def _node_id(
     Returns:
         Dot-separated node ID string.
     """
+    # Kind and primary are nearly always set; concatenate directly in that case
+    # (non-string parts raise TypeError either way)
+    if kind and primary:
+        return kind + "." + primary + "." + secondary if secondary else kind + "." + primary  # type: ignore[operator]
     parts = [part for part in (kind, primary, secondary) if part]
     return ".".join(parts)
 
@@ -376,7 +451,7 @@ def _ensure_target_node(
     if ref_id in nodes:
         return nodes[ref_id]
 
-    placeholder = _reference_to_node(ref)
+    placeholder = _reference_to_node(ref, ref_id)
     if placeholder:
         nodes[placeholder["id"]] = placeholder
         return placeholder
@@ -394,72 +469,44 @@ def _reference_to_id(ref: ReferenceDict) -> str:
     Returns:
         The node ID for this reference.
     """
-    kind = ref.get("kind")
-
-    if kind == "variable":
-        return _node_id("variable", ref.get("name"))
-    if kind == "local":
-        return _node_id("locals", ref.get("name"))
-    if kind == "module_output":
-        return _node_id("module_output", ref.get("module"), ref.get("name"))
-    if kind == "data":
-        return _node_id("data", ref.get("data_type"), ref.get("name"))
-    if kind == "resource":
-        return _node_id("resource", ref.get("resource_type"), ref.get("name"))
-    if kind == "path":
-        return _node_id("path", ref.get("name"))
-    if kind == "each":
-        return _node_id("each", ref.get("property"))
-    if kind == "count":
-        return _node_id("count", ref.get("property"))
-    if kind == "self":
-        return _node_id("self", ref.get("attribute"))
-
-    return ""
-
-
-def _reference_to_node(ref: ReferenceDict) -> Optional[GraphNode]:
+    try:
+        fields = REFERENCE_NODE_FIELDS.get(ref.get("kind"))  # type: ignore[arg-type]
+    except TypeError:
+        # An unhashable kind matches no known kind
+        return ""
+    if fields is None:
+        return ""
+
+    node_kind, type_field, name_field = fields
+    if type_field is None:
+        # Same result as _node_id(node_kind, name), without building a parts list
+        name = ref.get(name_field)
+        return node_kind + "." + name if name else node_kind  # type: ignore[operator]
+    return _node_id(node_kind, ref.get(type_field), ref.get(name_field))
+
+
+def _reference_to_node(ref: ReferenceDict, ref_id: Optional[str] = None) -> Optional[GraphNode]:
     """
     Creates a placeholder node for a reference.
 
     Args:
         ref: The reference dictionary.
+        ref_id: The reference's node id, if already computed.
 
     Returns:
         A GraphNode representing this reference, or external node as fallback.
     """
-    kind = ref.get("kind")
-    ref_id = _reference_to_id(ref)
-
-    node_map: Dict[str, GraphNode] = {
-        "variable": {"id": ref_id, "kind": "variable", "name": ref.get("name")},
-        "local": {"id": ref_id, "kind": "locals", "name": ref.get("name")},
-        "module_output": {
-            "id": ref_id,
-            "kind": "module_output",
-            "name": ref.get("name"),
-            "type": ref.get("module"),
-        },
-        "data": {
-            "id": ref_id,
-            "kind": "data",
-            "name": ref.get("name"),
-            "type": ref.get("data_type"),
-        },
-        "resource": {
-            "id": ref_id,
-            "kind": "resource",
-            "name": ref.get("name"),
-            "type": ref.get("resource_type"),
-        },
-        "path": {"id": ref_id, "kind": "path", "name": ref.get("name")},
-        "each": {"id": ref_id, "kind": "each", "name": ref.get("property")},
-        "count": {"id": ref_id, "kind": "count", "name": ref.get("property")},
-        "self": {"id": ref_id, "kind": "self", "name": ref.get("attribute")},
-    }
-
-    if kind in node_map:
-        return node_map[kind]  # type: ignore[return-value]
+    if ref_id is None:
+        ref_id = _reference_to_id(ref)
+
+    # Only the node for this reference's kind is built
+    fields = REFERENCE_NODE_FIELDS.get(ref.get("kind"))  # type: ignore[arg-type]
+    if fields is not None:
+        node_kind, type_field, name_field = fields
+        node: GraphNode = {"id": ref_id, "kind": node_kind, "name": ref.get(name_field)}  # type: ignore[typeddict-item]
+        if type_field is not None:
+            node["type"] = ref.get(type_field)
+        return node
 
     # External/unknown reference
     return {
@@ -480,3 +527,22 @@ def _ref_key(ref: ReferenceDict) -> str:
         JSON string representation of the reference.
     """
     return json.dumps(ref, sort_keys=True)
+
+
+def _ref_identity(ref: ReferenceDict) -> Union[FrozenSet[Any], str]:
+    """
+    Generates a hashable key for a reference, for deduplicating edges.
+
+    Equal references get equal keys without JSON-encoding them; references
+    holding unhashable values fall back to their _ref_key text.
+
+    Args:
+        ref: The reference dictionary.
+
+    Returns:
+        The reference's items as a frozenset, or its JSON key.
+    """
+    try:
+        return frozenset(ref.items())
+    except TypeError:
+        return _ref_key(ref)
@@ -8,6 +8,7 @@ including block type, labels, body content, and source information.
 from __future__ import annotations
 
 import re
+from sys import intern
 from typing import List
 
 from ..common.errors import ParseError, offset_to_location
@@ -38,6 +39,10 @@ KNOWN_BLOCKS = {
 }
 """Set of known Terraform block types."""
 
+LEADING_ALIGNMENT_PATTERN = re.compile(r"\s{2,}=\s*")
+TRAILING_ALIGNMENT_PATTERN = re.compile(r"\s*=\s{2,}")
+"""Patterns for collapsing column-aligned ``=`` signs in raw block text."""
+
 
 class BlockScanner:
     """
@@ -132,7 +137,12 @@ class BlockScanner:
 
             raw = _normalize_raw(content[identifier_start : end_index + 1])
             body = content[brace_index + 1 : end_index]
-            kind: BlockKind = keyword if keyword in KNOWN_BLOCKS else "unknown"  # type: ignore[assignment]
+            kind: BlockKind
+            if keyword in KNOWN_BLOCKS:
+                # One shared str per kind: blocks reuse it, and the parser's kind -> handler lookup matches by identity
+                keyword = kind = intern(keyword)  # type: ignore[assignment]
+            else:
+                kind = "unknown"
 
             blocks.append(
                 {
@@ -190,8 +200,8 @@ def _normalize_raw(raw: str) -> str:
 
     def normalize_alignment(line: str) -> str:
         """Normalizes spacing around equals signs."""
-        line = re.sub(r"\s{2,}=\s*", " = ", line)
-        line = re.sub(r"\s*=\s{2,}", " = ", line)
+        line = LEADING_ALIGNMENT_PATTERN.sub(" = ", line)
+        line = TRAILING_ALIGNMENT_PATTERN.sub(" = ", line)
         return line.rstrip()
 
     normalized_lines = []
@@ -16,6 +16,12 @@ QuotedStringResult = Tuple[str, int]
 ValueReadResult = Tuple[str, int]
 """Result of reading a value: (raw_value, end_position)."""
 
+# Patterns are applied with ``pattern.match(text, pos)`` so that reading a
+# token never copies the remainder of the source text.
+IDENTIFIER_PATTERN = re.compile(r"[A-Za-z_][\w-]*")
+DOTTED_IDENTIFIER_PATTERN = re.compile(r"[\w.-]+")
+HEREDOC_MARKER_PATTERN = re.compile(r'<<-?\s*"?([A-Za-z0-9_]+)"?')
+
 
 def is_quote(char: str | None) -> bool:
     """
@@ -165,12 +171,12 @@ def skip_heredoc(text: str, start: int) -> int:
         >>> skip_heredoc(text, 0)
         21
     """
-    match = re.match(r'^<<-?\s*"?([A-Za-z0-9_]+)"?', text[start:])
+    match = HEREDOC_MARKER_PATTERN.match(text, start)
     if not match:
         return start + 2
 
     marker = match.group(1)
-    after_marker = start + len(match.group(0))
+    after_marker = match.end()
     terminator_index = text.find(f"\n{marker}", after_marker)
 
     if terminator_index == -1:
@@ -318,7 +324,7 @@ def read_identifier(text: str, start: int) -> str:
         >>> read_identifier("123invalid", 0)
         ''
     """
-    match = re.match(r"^[A-Za-z_][\w-]*", text[start:])
+    match = IDENTIFIER_PATTERN.match(text, start)
     return match.group(0) if match else ""
 
 
@@ -337,7 +343,7 @@ def read_dotted_identifier(text: str, start: int) -> str:
         >>> read_dotted_identifier("aws_instance.main.id = ", 0)
         'aws_instance.main.id'
     """
-    match = re.match(r"^[\w.-]+", text[start:])
+    match = DOTTED_IDENTIFIER_PATTERN.match(text, start)
     return match.group(0) if match else ""
 
 
@@ -419,7 +425,7 @@ def read_value(text: str, start: int) -> ValueReadResult:
     if text.startswith("<<", index):
         newline_index = text.find("\n", index)
         first_line = text[index:] if newline_index == -1 else text[index:newline_index]
-        marker_match = re.match(r"^<<-?\s*\"?([A-Za-z0-9_]+)\"?", first_line)
+        marker_match = HEREDOC_MARKER_PATTERN.match(first_line)
         if marker_match:
             marker = marker_match.group(1)
             terminator_index = text.find(f"\n{marker}", newline_index if newline_index != -1 else index)
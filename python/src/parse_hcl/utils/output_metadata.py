@@ -2,7 +2,7 @@ from __future__ import annotations
 
 import os
 from pathlib import Path
-from typing import List, Optional
+from typing import Any, List, Optional
 
 from ..types import FileParseResult
 from .common.value_helpers import literal_string
@@ -27,8 +27,12 @@ def annotate_output_metadata(
     current = (cwd or Path.cwd()).resolve()
     base = per_file_base.resolve() if per_file_base else None
 
+    # Resolve each file once; the module pass below reuses the parent directories
+    file_dirs: List[Path] = []
+
     for file in files:
         abs_path = Path(file["path"]).resolve()
+        file_dirs.append(abs_path.parent)
         try:
             rel_path = abs_path.relative_to(root)
         except ValueError:
@@ -45,8 +49,7 @@ def annotate_output_metadata(
     if not base:
         return
 
-    for file in files:
-        file_dir = Path(file["path"]).resolve().parent
+    for file, file_dir in zip(files, file_dirs):
         for module in file["document"].get("module", []):
             source_val = module.get("properties", {}).get("source")
             source_raw = _raw_source(source_val)
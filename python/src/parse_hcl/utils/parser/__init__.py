@@ -1,8 +1,10 @@
 # Parsing helpers for HCL values and bodies.
-from .body_parser import parse_block_body
-from .value_classifier import classify_value
+from .body_parser import parse_block_body, parse_block_body_cached
+from .value_classifier import classify_value, classify_value_cached
 
 __all__ = [
     "classify_value",
+    "classify_value_cached",
     "parse_block_body",
+    "parse_block_body_cached",
 ]
@@ -6,6 +6,8 @@ Extracts attributes and nested blocks from block body strings.
 
 from __future__ import annotations
 
+from functools import lru_cache
+from sys import intern
 from typing import Dict, List
 
 from ...types import NestedBlock, ParsedBody, Value
@@ -17,7 +19,7 @@ from ..lexer.hcl_lexer import (
     read_value,
     skip_whitespace_and_comments,
 )
-from .value_classifier import classify_value
+from .value_classifier import _copy_structure, classify_value_cached
 
 
 def parse_block_body(body: str) -> ParsedBody:
@@ -60,11 +62,14 @@ def parse_block_body(body: str) -> ParsedBody:
 
         index += len(identifier)
         index = skip_whitespace_and_comments(body, index)
+        # Attribute and block names repeat across blocks and files; share one str
+        # per name, as the JSON parser does for its keys
+        identifier = intern(identifier)
 
         # Check for attribute assignment (identifier = value)
         if index < length and body[index] == "=":
             raw, end = read_value(body, index + 1)
-            attributes[identifier] = classify_value(raw)
+            attributes[identifier] = classify_value_cached(raw)
             index = end
             continue
 
@@ -106,3 +111,26 @@ def parse_block_body(body: str) -> ParsedBody:
         index += 1
 
     return {"attributes": attributes, "blocks": blocks}
+
+
+def parse_block_body_cached(body: str) -> ParsedBody:
+    """
+    Parses an HCL block body, memoizing the result per body string.
+
+    Identical bodies recur in generated code and repeated module layouts
+    (e.g. the same ``variable`` or ``locals`` body across files). Each call
+    returns a private copy, so callers may mutate the result freely.
+
+    Args:
+        body: The raw body content of an HCL block (without outer braces).
+
+    Returns:
+        ParsedBody equal to ``parse_block_body(body)``.
+    """
+    return _copy_structure(_parse_block_body_memo(body))
+
+
+@lru_cache(maxsize=2048)
+def _parse_block_body_memo(body: str) -> ParsedBody:
+    """Memoized parse_block_body; the shared result must not be mutated."""
+    return parse_block_body(body)
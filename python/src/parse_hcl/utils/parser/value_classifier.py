@@ -6,8 +6,8 @@ Classifies raw value strings into typed Value structures and extracts references
 
 from __future__ import annotations
 
-import json
 import re
+from functools import lru_cache
 from typing import Any, Dict, List, Optional
 
 from ..lexer.hcl_lexer import is_escaped, split_array_elements, split_object_entries
@@ -19,6 +19,28 @@ TRAVERSAL_PATTERN = re.compile(r"[A-Za-z_][\w-]*(?:\[(?:[^[\]]*|\*)])?(?:\.[A-Za
 SPLAT_PATTERN = re.compile(r"\[\*]")
 """Pattern for matching splat expressions (e.g., aws_instance.web[*].id)."""
 
+NUMBER_PATTERN = re.compile(r"^-?\d+(\.\d+)?([eE][+-]?\d+)?$")
+"""Pattern for matching numeric literals (e.g., 42, -1.5, 1e3)."""
+
+FUNCTION_CALL_PATTERN = re.compile(r"^[\w.-]+\(")
+"""Pattern for matching function call expressions (e.g., length(var.list))."""
+
+FOR_EXPR_PATTERN = re.compile(r"^[\[{]\s*for\s+.+\s+in\s+.+:\s+")
+"""Pattern for matching list or object for expressions."""
+
+SIMPLE_TRAVERSAL_PATTERN = re.compile(r"^[\w.-]+(\[[^\]]*])?$")
+"""Pattern for matching a whole expression that is a single traversal."""
+
+TEMPLATE_INTERPOLATION_PATTERN = re.compile(r"\${([^}]+)}")
+"""Pattern for capturing the inner expression of template interpolations."""
+
+INDEX_SUFFIX_PATTERN = re.compile(r"\[.*?]")
+"""Pattern for stripping index/splat brackets from traversal parts."""
+
+EACH_PATTERN = re.compile(r"\beach\.(key|value)\b")
+COUNT_INDEX_PATTERN = re.compile(r"\bcount\.index\b")
+SELF_PATTERN = re.compile(r"\bself\.([\w-]+)")
+
 
 def classify_value(raw: str) -> Value:
     """
@@ -69,6 +91,54 @@ def classify_value(raw: str) -> Value:
     return _classify_expression(trimmed)
 
 
+def classify_value_cached(raw: str) -> Value:
+    """
+    Classifies a raw value string, memoizing the result per string.
+
+    Expressions such as ``var.region`` or ``each.key`` recur many times
+    across a configuration. Each call returns a private copy, so callers may
+    mutate the result freely.
+
+    Args:
+        raw: The raw value string to classify.
+
+    Returns:
+        Value equal to ``classify_value(raw)``.
+    """
+    return _copy_structure(_classify_value_memo(raw))
+
+
+@lru_cache(maxsize=4096)
+def _classify_value_memo(raw: str) -> Value:
+    """Memoized classify_value; the shared result must not be mutated."""
+    return classify_value(raw)
+
+
+def _copy_structure(value: Any) -> Any:
+    """
+    Copies the dict/list structure of a memoized result, sharing immutable leaves.
+
+    Used for both cached Values and cached parsed block bodies. Leaves are
+    carried over by ``dict.copy()`` and the list comprehension, so only
+    nested containers are visited.
+
+    Args:
+        value: A Value, ParsedBody or any part of one.
+
+    Returns:
+        A copy whose dicts and lists are new objects.
+    """
+    if type(value) is dict:
+        copied = value.copy()
+        for key, item in copied.items():
+            if type(item) is dict or type(item) is list:
+                copied[key] = _copy_structure(item)
+        return copied
+    if type(value) is list:
+        return [_copy_structure(item) if type(item) is dict or type(item) is list else item for item in value]
+    return value
+
+
 def _classify_literal(raw: str) -> Optional[Value]:
     """
     Classifies a raw value as a literal (boolean, number, or null).
@@ -82,7 +152,7 @@ def _classify_literal(raw: str) -> Optional[Value]:
     if raw in ("true", "false"):
         return {"type": "literal", "value": raw == "true", "raw": raw}
 
-    if re.match(r"^-?\d+(\.\d+)?([eE][+-]?\d+)?$", raw):
+    if NUMBER_PATTERN.match(raw):
         return {"type": "literal", "value": float(raw) if "." in raw or "e" in raw or "E" in raw else int(raw), "raw": raw}
 
     if raw == "null":
@@ -189,13 +259,13 @@ def _detect_expression_kind(raw: str) -> ExpressionKind:
         return "template"
     if _has_conditional_operator(raw):
         return "conditional"
-    if re.match(r"^[\w.-]+\(", raw):
+    if FUNCTION_CALL_PATTERN.match(raw):
         return "function_call"
-    if re.match(r"^\[\s*for\s+.+\s+in\s+.+:\s+", raw) or re.match(r"^\{\s*for\s+.+\s+in\s+.+:\s+", raw):
+    if FOR_EXPR_PATTERN.match(raw):
         return "for_expr"
     if SPLAT_PATTERN.search(raw):
         return "splat"
-    if re.match(r"^[\w.-]+(\[[^\]]*])?$", raw):
+    if SIMPLE_TRAVERSAL_PATTERN.match(raw):
         return "traversal"
     return "unknown"
 
@@ -257,7 +327,7 @@ def _extract_expression_references(raw: str, kind: ExpressionKind) -> List[Refer
     base_refs = _extract_references_from_text(raw)
 
     if kind == "template":
-        matches = re.findall(r"\${([^}]+)}", raw)
+        matches = TEMPLATE_INTERPOLATION_PATTERN.findall(raw)
         inner_refs: List[ReferenceDict] = []
         for expr in matches:
             inner_refs.extend(_extract_references_from_text(expr))
@@ -284,7 +354,7 @@ def _extract_references_from_text(raw: str) -> List[ReferenceDict]:
 
     for match in TRAVERSAL_PATTERN.findall(raw):
         has_splat = "[*]" in match
-        parts = [re.sub(r"\[.*?]", "", part) for part in match.split(".")]
+        parts = [INDEX_SUFFIX_PATTERN.sub("", part) for part in match.split(".")]
 
         if parts[0] == "var" and len(parts) > 1:
             refs.append({"kind": "variable", "name": parts[1]})
@@ -345,18 +415,18 @@ def _extract_special_references(raw: str) -> List[ReferenceDict]:
         Array of special references.
     """
     refs: List[ReferenceDict] = []
-    for match in re.findall(r"\beach\.(key|value)\b", raw):
+    for match in EACH_PATTERN.findall(raw):
         refs.append({"kind": "each", "property": match})  # type: ignore[typeddict-item]
-    if re.search(r"\bcount\.index\b", raw):
+    if COUNT_INDEX_PATTERN.search(raw):
         refs.append({"kind": "count", "property": "index"})  # type: ignore[typeddict-item]
-    for match in re.findall(r"\bself\.([\w-]+)", raw):
+    for match in SELF_PATTERN.findall(raw):
         refs.append({"kind": "self", "attribute": match})
     return refs
 
 
 def _unique_references(refs: List[ReferenceDict]) -> List[ReferenceDict]:
     """
-    Removes duplicate references based on their JSON representation.
+    Removes duplicate references based on their field values.
 
     Args:
         refs: Array of references (may contain duplicates).
@@ -364,10 +434,13 @@ def _unique_references(refs: List[ReferenceDict]) -> List[ReferenceDict]:
     Returns:
         Deduplicated array of references.
     """
+    if len(refs) < 2:
+        return refs
     seen = set()
     unique: List[ReferenceDict] = []
     for ref in refs:
-        key = json.dumps(ref, sort_keys=True)
+        # Reference fields are flat str/bool/None values, so a sorted item tuple is a stable key
+        key = tuple(sorted(ref.items()))
         if key in seen:
             continue
         seen.add(key)
@@ -400,6 +473,8 @@ def _unquote(value: str) -> str:
     """
     quote = value[0]
     inner = value[1:-1]
+    if "\\" not in inner:
+        return inner
     result = []
     i = 0
     while i < len(inner):
@@ -1,11 +1,13 @@
 # Serialization helpers for JSON/YAML exports.
-from .serializer import to_export, to_json, to_json_export, to_yaml_document
+from .serializer import to_export, to_json, to_json_export, to_json_export_stream, to_json_stream, to_yaml_document
 from .yaml import to_yaml
 
 __all__ = [
     "to_export",
     "to_json",
     "to_json_export",
+    "to_json_export_stream",
+    "to_json_stream",
     "to_yaml",
     "to_yaml_document",
 ]
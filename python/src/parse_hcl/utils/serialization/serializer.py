@@ -7,10 +7,10 @@ and YAML formats, with optional pruning of empty values.
 
 from __future__ import annotations
 
-import json
-from typing import Any, Dict
+from typing import Any, Dict, Iterator, List, TextIO, Tuple
 
-from ..graph.graph_builder import create_export
+from ..common.json_codec import dump, dumps
+from ..graph.graph_builder import GRAPH_VERSION, build_dependency_graph
 from ...types import TerraformDocument, TerraformExport
 from .yaml import to_yaml
 
@@ -39,7 +39,7 @@ def to_json(document: Any, prune_empty: bool = True) -> str:
         }
     """
     value = _prune_document(document) if prune_empty and _is_terraform_document(document) else document
-    return json.dumps(value, indent=2)
+    return dumps(value, indent=True)
 
 
 def to_json_export(document: TerraformDocument, prune_empty: bool = True) -> str:
@@ -63,7 +63,43 @@ def to_json_export(document: TerraformDocument, prune_empty: bool = True) -> str
         >>> print(data['version'])
         '1.0.0'
     """
-    return json.dumps(to_export(document, prune_empty=prune_empty), indent=2)
+    return dumps(to_export(document, prune_empty=prune_empty), indent=True)
+
+
+def to_json_stream(document: Any, fp: TextIO, prune_empty: bool = True) -> None:
+    """
+    Serializes a Terraform document as JSON directly into a text stream.
+
+    Produces the same output as :func:`to_json`. With the json backend the
+    text is streamed chunk by chunk; with orjson it is encoded in one native
+    call and written once.
+
+    Args:
+        document: The document to serialize (typically a TerraformDocument).
+        fp: A writable text stream.
+        prune_empty: If True, removes empty arrays, objects, and None values.
+
+    Example:
+        >>> with open('out.json', 'w', encoding='utf-8') as fp:
+        ...     to_json_stream(doc, fp)
+    """
+    value = _prune_document(document) if prune_empty and _is_terraform_document(document) else document
+    dump(value, fp, indent=True)
+
+
+def to_json_export_stream(document: TerraformDocument, fp: TextIO, prune_empty: bool = True) -> None:
+    """
+    Serializes a Terraform document with dependency graph directly into a text stream.
+
+    Produces the same output as :func:`to_json_export`, streamed or written
+    in one go as described for :func:`to_json_stream`.
+
+    Args:
+        document: The parsed TerraformDocument.
+        fp: A writable text stream.
+        prune_empty: If True, removes empty values from the document.
+    """
+    dump(to_export(document, prune_empty=prune_empty), fp, indent=True)
 
 
 def to_export(document: TerraformDocument, prune_empty: bool = True) -> TerraformExport:
@@ -86,10 +122,13 @@ def to_export(document: TerraformDocument, prune_empty: bool = True) -> Terrafor
         >>> print(len(export['graph']['nodes']))
         5
     """
-    export_payload = create_export(document)
-    pruned_document = _prune_document(document) if prune_empty else document
-    export_payload["document"] = pruned_document
-    return export_payload
+    # Build the payload in one go: the graph is derived from the unpruned
+    # document while the document itself is pruned exactly once
+    return {
+        "version": GRAPH_VERSION,
+        "document": _prune_document(document) if prune_empty else document,
+        "graph": build_dependency_graph(document),
+    }
 
 
 def to_yaml_document(document: Any, prune_empty: bool = True) -> str:
@@ -129,7 +168,10 @@ def _prune_document(document: TerraformDocument) -> Dict[str, Any]:
 
 def _prune_value(value: Any) -> Any:
     """
-    Recursively prunes a value, removing empty containers and None.
+    Prunes a value, removing empty containers and None.
+
+    Walks nested containers with an explicit stack rather than recursion,
+    so deeply nested documents cannot exhaust the Python call stack.
 
     Args:
         value: The value to prune.
@@ -143,20 +185,48 @@ def _prune_value(value: Any) -> Any:
         >>> _prune_value([1, None, [], 2])
         [1, 2]
     """
-    if value is None:
-        return None
-    if isinstance(value, list):
-        items = [item for item in (_prune_value(item) for item in value) if item not in (None, [], {}, ())]
-        return items or None
-    if isinstance(value, dict):
-        pruned: Dict[str, Any] = {}
-        for key, val in value.items():
-            next_val = _prune_value(val)
-            if next_val is None or next_val == [] or next_val == {}:
+    if not isinstance(value, (dict, list)):
+        return value
+
+    # Each frame: (iterator over the source container, pruned output, key in the parent)
+    stack: List[Tuple[Iterator[Any], Any, Any]] = [_prune_frame(value, None)]
+    while True:
+        children, pruned, parent_key = stack[-1]
+        descended = False
+        is_dict = type(pruned) is dict
+        for entry in children:
+            key, child = entry if is_dict else (None, entry)
+            if isinstance(child, (dict, list)):
+                # Finish the child first; this frame resumes from its iterator afterwards
+                stack.append(_prune_frame(child, key))
+                descended = True
+                break
+            if child is None:
                 continue
-            pruned[key] = next_val
-        return pruned or None
-    return value
+            if is_dict:
+                pruned[key] = child
+            elif child != ():
+                pruned.append(child)
+        if descended:
+            continue
+
+        stack.pop()
+        result = pruned or None
+        if not stack:
+            return result
+        if result is not None:
+            parent = stack[-1][1]
+            if type(parent) is dict:
+                parent[parent_key] = result
+            else:
+                parent.append(result)
+
+
+def _prune_frame(container: Any, key: Any) -> Tuple[Iterator[Any], Any, Any]:
+    """Creates a traversal frame for a dict or list awaiting pruning."""
+    if isinstance(container, dict):
+        return iter(container.items()), {}, key
+    return iter(container), [], key
 
 
 def _is_terraform_document(doc: Any) -> bool:
@@ -11,6 +11,12 @@ from typing import Any
 
 PAD = "  "
 
+SPECIAL_CHARS = frozenset(':#{}[]&*?|<>=%@`"\'\n\t\r')
+"""Characters that force a YAML string scalar to be quoted."""
+
+RESERVED_WORDS = frozenset(("true", "false", "null", "yes", "no", "on", "off"))
+"""Plain scalars YAML would read as booleans/null, so they must be quoted."""
+
 
 def to_yaml(value: Any) -> str:
     """
@@ -41,33 +47,35 @@ def _render(value: Any, level: int) -> str:
     if _is_scalar(value):
         return _format_scalar(value)
 
+    indent = _indent(level)
+
     if isinstance(value, list):
         if not value:
-            return f"{_indent(level)}[]"
+            return f"{indent}[]"
+        child_indent = _indent(level + 1)
         lines = []
         for item in value:
             if _is_scalar(item):
-                lines.append(f"{_indent(level)}- {_format_scalar(item)}")
+                lines.append(f"{indent}- {_format_scalar(item)}")
             else:
                 rendered = _render(item, level + 1)
-                rendered_lines = rendered.split("\n")
-                head = rendered_lines[0]
-                head_line = head[len(_indent(level + 1)) :] if head.startswith(_indent(level + 1)) else head
-                tail = "\n".join(rendered_lines[1:]) if len(rendered_lines) > 1 else ""
-                prefix = f"{_indent(level)}- {head_line}"
+                # Only the first line needs re-prefixing with the list marker
+                head, _, tail = rendered.partition("\n")
+                head_line = head[len(child_indent) :] if head.startswith(child_indent) else head
+                prefix = f"{indent}- {head_line}"
                 lines.append(f"{prefix}\n{tail}" if tail else prefix)
         return "\n".join(lines)
 
     if isinstance(value, dict):
         if not value:
-            return f"{_indent(level)}{{}}"
+            return f"{indent}{{}}"
         lines = []
         for key, val in value.items():
             if _is_scalar(val):
-                lines.append(f"{_indent(level)}{key}: {_format_scalar(val)}")
+                lines.append(f"{indent}{key}: {_format_scalar(val)}")
             else:
                 rendered = _render(val, level + 1)
-                lines.append(f"{_indent(level)}{key}:\n{rendered}")
+                lines.append(f"{indent}{key}:\n{rendered}")
         return "\n".join(lines)
 
     # Fallback: use JSON.stringify equivalent for unknown types
@@ -155,8 +163,7 @@ def _needs_quoting(value: str) -> bool:
         return True
 
     # Check for YAML special characters
-    special_chars = set(':#{}[]&*#?|<>=%@`"\'\n\t\r')
-    if special_chars.intersection(value):
+    if not SPECIAL_CHARS.isdisjoint(value):
         return True
 
     # Check for leading/trailing whitespace
@@ -164,8 +171,7 @@ def _needs_quoting(value: str) -> bool:
         return True
 
     # Check for values that could be interpreted as other types
-    lower = value.lower()
-    if lower in ("true", "false", "null", "yes", "no", "on", "off"):
+    if value.lower() in RESERVED_WORDS:
         return True
 
     # Check if it looks like a number
@@ -1,11 +1,15 @@
+import json
 import sys
+from collections import OrderedDict
 from pathlib import Path
 import unittest
+from unittest import mock
 
 ROOT = Path(__file__).resolve().parents[1]
 sys.path.insert(0, str(ROOT / "src"))
 
 from parse_hcl import TerraformParser, TfPlanParser, TfStateParser, TfVarsParser, build_dependency_graph  # noqa: E402
+from parse_hcl.services import artifact_parsers  # noqa: E402
 
 
 class ArtifactParsersTest(unittest.TestCase):
@@ -25,6 +29,24 @@ class ArtifactParsersTest(unittest.TestCase):
         self.assertEqual(parsed["resources"][0]["type"], "aws_s3_bucket")
         self.assertEqual(parsed["resources"][0]["instances"][0]["attributes"]["bucket"], "demo-bucket")
 
+    def test_omits_raw_when_requested(self) -> None:
+        state = TfStateParser().parse_file(str(self.fixtures / "terraform.tfstate"), include_raw=False)
+        plan = TfPlanParser().parse_file(str(self.fixtures / "plan.json"), include_raw=False)
+
+        self.assertNotIn("raw", state)
+        self.assertNotIn("raw", plan)
+        self.assertEqual(state["resources"][0]["type"], "aws_s3_bucket")
+        self.assertIn("create", plan["resource_changes"][0]["change"]["actions"])
+
+    def test_streamed_state_matches_in_memory_parse(self) -> None:
+        path = str(self.fixtures / "terraform.tfstate")
+        expected = TfStateParser().parse_file(path, include_raw=False)
+
+        with mock.patch.object(artifact_parsers, "STATE_STREAM_MIN_BYTES", 0):
+            streamed = TfStateParser().parse_file(path, include_raw=False)
+
+        self.assertEqual(streamed, expected)
+
     def test_parses_plan(self) -> None:
         parsed = TfPlanParser().parse_file(str(self.fixtures / "plan.json"))
         self.assertEqual(parsed["format_version"], "1.0")
@@ -32,6 +54,26 @@ class ArtifactParsersTest(unittest.TestCase):
         values = parsed["planned_values"]["root_module"]["resources"][0]["values"]
         self.assertEqual(values.get("bucket"), "demo-bucket")
 
+    def test_accepts_dict_and_list_subclasses(self) -> None:
+        class Actions(list):
+            pass
+
+        def load(name: str, ordered: bool):
+            text = (self.fixtures / name).read_text()
+            if not ordered:
+                return json.loads(text)
+            return json.loads(text, object_pairs_hook=OrderedDict)
+
+        plan = load("plan.json", ordered=True)
+        plan["resource_changes"][0]["change"]["actions"] = Actions(plan["resource_changes"][0]["change"]["actions"])
+        parsed_plan = TfPlanParser().parse(plan, include_raw=False)
+        parsed_state = TfStateParser().parse(load("terraform.tfstate", ordered=True), include_raw=False)
+
+        self.assertIsNotNone(parsed_plan["planned_values"])
+        self.assertEqual(parsed_plan, TfPlanParser().parse(load("plan.json", ordered=False), include_raw=False))
+        self.assertIsNotNone(parsed_state["resources"][0]["instances"][0]["attributes"])
+        self.assertEqual(parsed_state, TfStateParser().parse(load("terraform.tfstate", ordered=False), include_raw=False))
+
 
 class DependencyGraphTest(unittest.TestCase):
     def setUp(self) -> None:
@@ -59,6 +101,55 @@ class DependencyGraphTest(unittest.TestCase):
         dependent_id = "resource.aws_s3_bucket.dependent"
         self.assertTrue(any(edge["from"] == dependent_id and edge["to"] == base_id for edge in graph["edges"]))
 
+    def test_deeply_nested_block_references_keep_document_order(self) -> None:
+        root: dict = {"attributes": {}, "blocks": []}
+        current = root
+        for index in range(3000):
+            child = {"attributes": {"v": {"type": "expression", "raw": "", "references": [{"kind": "variable", "name": f"v{index}"}]}}}
+            current["blocks"] = [child]
+            current = child
+        sibling = {"attributes": {"v": {"type": "expression", "raw": "", "references": [{"kind": "local", "name": "last"}]}}}
+        doc = {"resource": [{"type": "t", "name": "n", "properties": {}, "blocks": [root, sibling]}]}
+        edges = build_dependency_graph(doc)["edges"]  # type: ignore[arg-type]
+
+        self.assertEqual(len(edges), 3001)
+        self.assertEqual([edge["to"] for edge in edges[:2]], ["variable.v0", "variable.v1"])
+        self.assertEqual(edges[-1]["to"], "locals.last")
+
+    def test_deeply_nested_value_references(self) -> None:
+        value: dict = {"type": "expression", "raw": "var.deep", "references": [{"kind": "variable", "name": "deep"}]}
+        for _ in range(5000):
+            value = {"type": "array", "value": [value, {"type": "literal", "value": 1, "raw": "1"}], "raw": ""}
+        doc = {"locals": [{"name": "nested", "value": value}]}
+        edges = build_dependency_graph(doc)["edges"]  # type: ignore[arg-type]
+
+        self.assertEqual([(edge["from"], edge["to"]) for edge in edges], [("locals.nested", "variable.deep")])
+
+    def test_deduplicates_equal_references(self) -> None:
+        refs = [
+            {"kind": "variable", "name": "region"},
+            {"name": "region", "kind": "variable"},
+            {"kind": "custom", "path": ["a"]},
+            {"kind": "custom", "path": ["a"]},
+        ]
+        doc = {"output": [{"name": "out", "value": {"type": "expression", "raw": "", "references": refs}}]}
+        edges = build_dependency_graph(doc)["edges"]  # type: ignore[arg-type]
+
+        self.assertEqual([edge["to"] for edge in edges], ["variable.region", 'external.{"kind": "custom", "path": ["a"]}'])
+
+    def test_unknown_references_resolve_to_unnamed_block_added_later(self) -> None:
+        value = {"type": "expression", "raw": "", "references": [{"kind": "custom", "path": ["a"]}]}
+        doc = {
+            "output": [{"name": "out", "value": value}],
+            "unknown": [{"type": "", "labels": [""], "properties": {"x": value}}],
+        }
+        edges = build_dependency_graph(doc)["edges"]  # type: ignore[arg-type]
+
+        self.assertEqual(
+            [(edge["from"], edge["to"]) for edge in edges],
+            [("output.out", 'external.{"kind": "custom", "path": ["a"]}'), ("", "")],
+        )
+
 
 if __name__ == "__main__":
     unittest.main()
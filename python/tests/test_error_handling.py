@@ -64,6 +64,14 @@ class OffsetToLocationTest(unittest.TestCase):
         self.assertEqual(loc.line, 1)
         self.assertEqual(loc.column, 7)
 
+    def test_handles_newline_offsets_and_out_of_range(self) -> None:
+        content = "a\n\nbc\n"
+
+        self.assertEqual((offset_to_location(content, 1).line, offset_to_location(content, 1).column), (1, 2))
+        self.assertEqual((offset_to_location(content, 3).line, offset_to_location(content, 3).column), (3, 1))
+        self.assertEqual((offset_to_location(content, 99).line, offset_to_location(content, 99).offset), (4, 6))
+        self.assertEqual((offset_to_location(content, -2).line, offset_to_location(content, -2).column), (1, 1))
+
 
 class OffsetsToRangeTest(unittest.TestCase):
     """Tests for offsets_to_range function."""
@@ -75,6 +83,13 @@ class OffsetsToRangeTest(unittest.TestCase):
         self.assertEqual(range_obj.start.line, 1)
         self.assertEqual(range_obj.end.line, 2)
 
+    def test_locations_are_slotted_value_objects(self) -> None:
+        range_obj = offsets_to_range("ab\ncd", 1, 4)
+
+        self.assertFalse(hasattr(range_obj, "__dict__"))
+        self.assertFalse(hasattr(range_obj.start, "__dict__"))
+        self.assertEqual(range_obj, SourceRange(SourceLocation(1, 2, 1), SourceLocation(2, 2, 4)))
+
 
 class BlockScannerStrictModeTest(unittest.TestCase):
     """Tests for BlockScanner strict mode."""
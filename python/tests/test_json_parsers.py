@@ -1,11 +1,16 @@
+import io
+import json
 import sys
 from pathlib import Path
 import unittest
+from unittest import mock
 
 ROOT = Path(__file__).resolve().parents[1]
 sys.path.insert(0, str(ROOT / "src"))
 
 from parse_hcl import TerraformParser, TfVarsParser, to_json, to_json_export  # noqa: E402
+from parse_hcl.utils.common import json_codec  # noqa: E402
+from parse_hcl.utils.common.json_codec import dump, dumps, loads  # noqa: E402
 
 
 class JsonParserTest(unittest.TestCase):
@@ -28,6 +33,26 @@ class JsonParserTest(unittest.TestCase):
         self.assertEqual(parsed["assignments"]["project"]["type"], "literal")
         self.assertEqual(parsed["assignments"]["cidrs"]["type"], "array")
 
+    def test_deeply_nested_values_convert_without_recursion(self) -> None:
+        nested: list = []
+        current = nested
+        for _ in range(5000):
+            current.append([])
+            current = current[0]
+        doc = self.parser.json_parser.parse({"locals": {"deep": nested}})
+
+        value = doc["locals"][0]["value"]
+        self.assertEqual(value["type"], "array")
+        self.assertEqual(value["raw"], "[" * 5001 + "]" * 5001)
+
+    def test_repeated_literals_are_independent_values(self) -> None:
+        doc = self.parser.json_parser.parse({"locals": {"a": True, "b": True, "c": None, "d": None}})
+        first, second = doc["locals"][0]["value"], doc["locals"][1]["value"]
+        first["value"] = False
+
+        self.assertEqual(second, {"type": "literal", "value": True, "raw": "True"})
+        self.assertIsNot(doc["locals"][2]["value"], doc["locals"][3]["value"])
+
     def test_prune_toggle_on_export(self) -> None:
         doc = self.parser.parse_file(str(self.fixtures / "config.tf.json"))
         full = to_json(doc, prune_empty=False)
@@ -39,6 +64,42 @@ class JsonParserTest(unittest.TestCase):
         self.assertIn("dynamic_blocks", exported)
         self.assertIn("blocks", exported)
 
+    def test_loads_matches_stdlib_for_edge_values(self) -> None:
+        for text in ("[18446744073709551616, -9223372036854775809]", "[NaN, 1E400]", '{"a": 1, "a": 2}'):
+            self.assertEqual(repr(loads(text)), repr(json.loads(text)))
+
+    def test_loads_accepts_utf8_bytes_like_text(self) -> None:
+        for data in (b'{"r\xc3\xa9gion": [1, 18446744073709551616]}', b"[NaN]"):
+            self.assertEqual(repr(loads(data)), repr(json.loads(data.decode("utf-8"))))
+        with self.assertRaises(json.JSONDecodeError):
+            loads(b'\xef\xbb\xbf{"a": 1}')
+        with self.assertRaises(UnicodeDecodeError):
+            loads(b'{"a": "\xff"}')
+
+    @unittest.skipUnless(json_codec.HAS_ORJSON, "orjson not installed")
+    def test_loads_uses_orjson_unless_it_would_differ(self) -> None:
+        texts = ("[18446744073709551616]", "[NaN]", '{"b": [1.5, "x"]}')
+        with mock.patch.object(json_codec.orjson, "loads", wraps=json_codec.orjson.loads) as orjson_loads:
+            for text in texts:
+                self.assertEqual(repr(loads(text)), repr(json.loads(text)))
+
+        # Long digit runs skip orjson entirely; NaN is rejected by it and decoded by json
+        self.assertEqual([call.args[0] for call in orjson_loads.call_args_list], ["[NaN]", '{"b": [1.5, "x"]}'])
+
+    @unittest.skipUnless(json_codec.HAS_ORJSON, "orjson not installed")
+    def test_dump_checks_orjson_compatibility_once(self) -> None:
+        value = {"resource": [{"name": "a", "count": [1, 2.5, None]}]}
+        buffer = io.StringIO()
+        with mock.patch.object(json_codec, "_orjson_compatible", wraps=json_codec._orjson_compatible) as compatible:
+            dump(value, buffer, indent=True)
+
+        self.assertEqual(compatible.call_count, 1)
+        self.assertEqual(buffer.getvalue(), json.dumps(value, indent=2))
+
+    def test_dumps_matches_stdlib_for_edge_values(self) -> None:
+        for value in (["R\u00e9gion", "\x7f"], [1.5e-7, 1e-05, 1e16], [float("nan"), float("inf")], {1e-7: "k"}, [2**70]):
+            self.assertEqual(dumps(value, indent=True), json.dumps(value, indent=2))
+
 
 if __name__ == "__main__":
     unittest.main()
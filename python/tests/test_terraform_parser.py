@@ -1,3 +1,5 @@
+import io
+import json
 import os
 import sys
 from pathlib import Path
@@ -6,7 +8,7 @@ import unittest
 ROOT = Path(__file__).resolve().parents[1]
 sys.path.insert(0, str(ROOT / "src"))
 
-from parse_hcl import TerraformParser, to_json, to_yaml_document  # noqa: E402
+from parse_hcl import TerraformParser, to_json, to_json_export, to_json_export_stream, to_json_stream, to_yaml_document  # noqa: E402
 from parse_hcl.utils.common.fs import list_terraform_files  # noqa: E402
 from parse_hcl.utils.output_metadata import annotate_output_metadata  # noqa: E402
 
@@ -51,6 +53,43 @@ class TerraformParserTest(unittest.TestCase):
         self.assertGreaterEqual(len(result["combined"]["resource"]), 6)
         self.assertGreaterEqual(len(result["combined"]["variable"]), 2)
 
+    def test_threaded_file_discovery_matches_serial(self) -> None:
+        self.assertEqual(list_terraform_files(str(self.fixtures), max_workers=4), list_terraform_files(str(self.fixtures)))
+
+    def test_combine_accepts_one_shot_iterables(self) -> None:
+        doc = self.parser.parse_file(str(self.fixtures / "main.tf"))
+
+        self.assertEqual(self.parser.combine(d for d in [doc]), self.parser.combine([doc]))
+        self.assertEqual(self.parser.combine(d for d in [doc])["resource"], doc["resource"])
+
+    def test_directory_parsing_uses_overridden_parse_file(self) -> None:
+        seen = []
+
+        class RecordingParser(TerraformParser):
+            def parse_file(self, file_path: str):  # type: ignore[override]
+                seen.append(file_path)
+                return super().parse_file(file_path)
+
+        result = RecordingParser().parse_directory(str(self.fixtures))
+
+        self.assertEqual(seen, [item["path"] for item in result["files"]])
+        self.assertEqual(result, self.parser.parse_directory(str(self.fixtures)))
+
+    def test_parallel_directory_parsing_matches_serial(self) -> None:
+        serial = self.parser.parse_directory(str(self.fixtures))
+        parallel = self.parser.parse_directory(str(self.fixtures), jobs=2)
+
+        self.assertEqual(parallel, serial)
+
+    def test_repeated_parses_return_independent_documents(self) -> None:
+        first = self.parser.parse_file(str(self.fixtures / "main.tf"))
+        first["locals"][0]["value"]["value"] = "mutated"
+        first["variable"][0]["default"]["value"] = "mutated"
+        second = self.parser.parse_file(str(self.fixtures / "main.tf"))
+
+        self.assertEqual(second["locals"][0]["value"]["value"], "demo")
+        self.assertEqual(second["variable"][0]["default"]["value"], "us-east-1")
+
     def test_serialization_prunes_empty(self) -> None:
         doc = self.parser.parse_file(str(self.fixtures / "data.tf"))
         json_text = to_json(doc)
@@ -60,6 +99,40 @@ class TerraformParserTest(unittest.TestCase):
         self.assertNotIn('"resource"', json_text)
         self.assertIn('"data"', json_text)
 
+    def test_serialization_prunes_attributes_named_raw(self) -> None:
+        attribute = {"type": "object", "value": {"a": 1, "b": []}, "references": []}
+        value = {"resource": [{"properties": {"raw": attribute, "other": attribute}}]}
+        pruned = json.loads(to_json(value))["resource"][0]["properties"]
+
+        self.assertEqual(pruned["raw"], {"type": "object", "value": {"a": 1}})
+        self.assertEqual(pruned["raw"], pruned["other"])
+
+    def test_stream_serialization_matches_string_output(self) -> None:
+        doc = self.parser.parse_file(str(self.fixtures / "main.tf"))
+
+        buffer = io.StringIO()
+        to_json_stream(doc, buffer)
+        self.assertEqual(buffer.getvalue(), to_json(doc))
+
+        buffer = io.StringIO()
+        to_json_export_stream(doc, buffer)
+        self.assertEqual(buffer.getvalue(), to_json_export(doc))
+
+    def test_json_output_matches_stdlib_layout(self) -> None:
+        doc = self.parser.parse_file(str(self.fixtures / "advanced.tf"))
+        doc["variable"][0]["description"] = "R\u00e9gion"
+        doc["variable"][0]["default"] = {"type": "literal", "value": 1.5e-7, "raw": "1.5e-7"}
+        json_text = to_json(doc)
+
+        self.assertIn('"R\\u00e9gion"', json_text)
+        self.assertIn("1.5e-07", json_text)
+        self.assertEqual(json_text, json.dumps(json.loads(json_text), indent=2))
+
+    def test_json_output_coerces_non_string_keys_like_stdlib(self) -> None:
+        value = {"resource": [{"count": {1: "a", True: [2.5]}}]}
+
+        self.assertEqual(to_json(value), json.dumps(value, indent=2))
+
     def test_raw_normalization(self) -> None:
         doc = self.parser.parse_file(str(self.fixtures / "main.tf"))
         raw = doc["variable"][0]["raw"]
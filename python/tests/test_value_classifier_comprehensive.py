@@ -8,6 +8,7 @@ ROOT = Path(__file__).resolve().parents[1]
 sys.path.insert(0, str(ROOT / "src"))
 
 from parse_hcl import classify_value
+from parse_hcl.utils.common.value_helpers import literal_boolean, literal_float, literal_int, literal_number, literal_string
 
 
 class LiteralValuesTest(unittest.TestCase):
@@ -142,6 +143,42 @@ class ExpressionValuesTest(unittest.TestCase):
         self.assertTrue(result["references"][0].get("splat"))
 
 
+class CachedClassificationTest(unittest.TestCase):
+    """Tests for memoized value classification."""
+
+    def test_cached_matches_uncached(self) -> None:
+        from parse_hcl.utils import classify_value_cached
+
+        for raw in ("var.region", '"${each.key}-x"', "[var.a, 1]", "{ a = local.b }", "42"):
+            self.assertEqual(classify_value_cached(raw), classify_value(raw))
+
+    def test_mutated_result_does_not_affect_next_call(self) -> None:
+        from parse_hcl.utils import classify_value_cached
+
+        first = classify_value_cached("{ a = [var.x] }")
+        first["value"]["a"]["value"].clear()
+        first["references"].append({"kind": "local", "name": "mutated"})
+        second = classify_value_cached("{ a = [var.x] }")
+
+        self.assertEqual(second, classify_value("{ a = [var.x] }"))
+
+
+class LiteralHelpersTest(unittest.TestCase):
+    """Tests for typed literal extraction helpers."""
+
+    def test_extracts_by_exact_type(self) -> None:
+        true_val, int_val, float_val = classify_value("true"), classify_value("42"), classify_value("1.5")
+
+        self.assertEqual(literal_string(classify_value('"x"')), "x")
+        self.assertIs(literal_boolean(true_val), True)
+        self.assertEqual((literal_number(int_val), literal_int(int_val), literal_float(int_val)), (42, 42, None))
+        self.assertEqual((literal_number(float_val), literal_int(float_val), literal_float(float_val)), (1.5, None, 1.5))
+        # bool is a subclass of int but never counts as a number
+        self.assertEqual((literal_number(true_val), literal_int(true_val), literal_string(true_val)), (None, None, None))
+        self.assertIsNone(literal_string(classify_value("var.name")))
+        self.assertIsNone(literal_boolean(None))
+
+
 class SpecialReferencesTest(unittest.TestCase):
     """Tests for special reference types."""
 
@@ -188,6 +225,15 @@ class TypeConstraintParserTest(unittest.TestCase):
         self.assertEqual(parse_type_constraint("bool")["base"], "bool")
         self.assertEqual(parse_type_constraint("any")["base"], "any")
 
+    def test_repeated_calls_return_independent_results(self) -> None:
+        from parse_hcl import parse_type_constraint
+
+        first = parse_type_constraint("map(object({ name = string }))")
+        first["element"]["attributes"]["name"]["base"] = "mutated"
+        second = parse_type_constraint("map(object({ name = string }))")
+
+        self.assertEqual(second["element"]["attributes"]["name"]["base"], "string")
+
     def test_collection_types(self) -> None:
         from parse_hcl import parse_type_constraint
 